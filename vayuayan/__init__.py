@@ -45,10 +45,13 @@ from .exceptions import (
 # Import utility functions that might be useful for users
 from .utils import (
     analyze_station_data,
+    aqi_categories,
     clean_station_name,
     convert_station_data_to_dataframe,
+    fetch_many,
     get_aqi_category,
     haversine_distance,
+    haversine_many,
     stations_to_dataframe,
 )
 
@@ -76,7 +79,10 @@ __all__ = [
     "convert_station_data_to_dataframe",
     "analyze_station_data",
     "get_aqi_category",
+    "aqi_categories",
     "haversine_distance",
+    "haversine_many",
+    "fetch_many",
 ]
 
 
@@ -6,10 +6,17 @@ Central Pollution Control Board (CPCB) including AQI data, live monitoring data,
 and PM2.5 satellite data.
 """
 
-import base64
-import json
+import hashlib
+import math
 import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
@@ -20,15 +27,76 @@ import pandas as pd
 import requests
 import rioxarray
 import xarray as xr
-from geopy.distance import geodesic
+from affine import Affine
+from rasterio.features import geometry_mask
+from rasterio.windows import Window
 from tqdm import tqdm
 
+from .constants import (
+    DEFAULT_MAX_RETRIES,
+    HISTORICAL_CACHE_TTL,
+    STATION_LIST_TTL,
+)
+from .utils import (
+    StationDistanceIndex,
+    _label_stats,
+    _nan_stats,
+    _station_date_body,
+    _url_encode_bytes,
+    decode_base64_json,
+    get_session,
+)
+
+try:
+    import python_calamine  # noqa: F401
+
+    # The Rust-based calamine reader parses xlsx much faster than openpyxl;
+    # pandas only accepts engine="calamine" from 2.2 on
+    _PANDAS_VERSION = tuple(map(int, re.findall(r"\d+", pd.__version__)[:2]))
+    _EXCEL_ENGINE: Optional[str] = "calamine" if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:  # calamine is an optional speedup
+    _EXCEL_ENGINE = None
+
+try:
+    import h5netcdf  # noqa: F401
+
+    # h5netcdf reads HDF5-based NetCDF files faster than libnetcdf
+    _NETCDF_ENGINE: Optional[str] = "h5netcdf"
+except ImportError:  # h5netcdf is an optional speedup
+    _NETCDF_ENGINE = None
+
+try:
+    import dask  # noqa: F401
+
+    # Lazily backed chunks keep the read limited to the polygon subset
+    _NETCDF_CHUNKS: Optional[str] = "auto"
+except ImportError:  # dask is an optional speedup
+    _NETCDF_CHUNKS = None
+
+try:
+    import pyarrow  # noqa: F401
+
+    # pyogrio can hand the features over as Arrow arrays instead of objects
+    _USE_ARROW = True
+except ImportError:  # pyarrow is an optional speedup
+    _USE_ARROW = False
+
 
 class CPCBHistorical:
     """Client for fetching historical Air Quality Index (AQI) data from CPCB."""
 
-    def __init__(self) -> None:
-        """Initialize the AQI Client with CPCB endpoints and headers."""
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """Initialize the AQI Client with CPCB endpoints and headers.
+
+        Args:
+            cache_dir: Directory where parsed data files of completed years are
+                cached for ``HISTORICAL_CACHE_TTL`` seconds (for example
+                ``HISTORICAL_CACHE_DIR``). None (the default) always downloads
+                them. Caching needs pyarrow, as the files are stored as Parquet.
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        # Pooled keep-alive session that retries transient failures
+        self.session = get_session(DEFAULT_MAX_RETRIES, 0.3)
         self.base_url = "https://airquality.cpcb.gov.in"
         self.base_path = f"{self.base_url}/dataRepository/download_file?file_name="
         self.data_repository = "/dataRepository/"
@@ -40,31 +108,101 @@ class CPCBHistorical:
             "Accept": "q=0.8;application/json;q=0.9",
         }
 
-    def _encode_base64(self, data: bytes) -> str:
-        """Encode bytes to base64 string.
+        # Station/city dropdown and the monotonic time it was fetched, reused
+        # for STATION_LIST_TTL seconds
+        self._complete_list: Optional[Dict] = None
+        self._complete_list_time = 0.0
+        # Station ID -> station entry, built from the dropdown it is keyed on
+        self._stations_by_id: Dict[str, Dict] = {}
+        self._stations_by_id_source: Optional[Dict] = None
+
+    def _read_excel_file(self, file_url: str, year: str) -> pd.DataFrame:
+        """Download an Excel data file on the pooled session and parse it.
+
+        When a ``cache_dir`` is set and pyarrow is installed, parsed frames of
+        completed years are stored there as Parquet, keyed by a hash of the URL,
+        and reused for ``HISTORICAL_CACHE_TTL`` seconds so republished
+        workbooks are eventually picked up.
 
         Args:
-            data: Bytes to encode.
+            file_url: URL of the Excel file.
+            year: Year the file holds data for.
 
         Returns:
-            Base64 encoded string.
+            Parsed DataFrame.
+
+        Raises:
+            requests.RequestException: If the download fails.
         """
-        return base64.b64encode(data).decode("utf-8")
+        cache_path = None
+        if (
+            self.cache_dir is not None
+            and _USE_ARROW
+            and str(year).isdigit()
+            and int(year) < datetime.now().year
+        ):
+            key = hashlib.sha256(file_url.encode("utf-8")).hexdigest()[:16]
+            cache_path = self.cache_dir / f"{key}.parquet"
+            try:
+                if time.time() - cache_path.stat().st_mtime < HISTORICAL_CACHE_TTL:
+                    return pd.read_parquet(cache_path)
+            except (OSError, ValueError):
+                pass  # Not cached yet or unreadable; download again
+
+        response = self.session.get(file_url, timeout=60)
+        response.raise_for_status()
+        df = pd.read_excel(BytesIO(response.content), engine=_EXCEL_ENGINE)
 
-    def _decode_base64(self, data: str) -> str:
-        """Decode base64 string to UTF-8 string.
+        if cache_path is not None:
+            self._write_cache(cache_path, df)
+        return df
 
-        Args:
-            data: Base64 encoded string.
+    def _write_cache(self, cache_path: Path, df: pd.DataFrame) -> None:
+        """Store a parsed frame in the cache directory, best effort.
 
-        Returns:
-            Decoded UTF-8 string.
+        Expired entries are removed first so the directory does not grow
+        without bound.
+
+        Args:
+            cache_path: Parquet file to write.
+            df: Frame to store.
         """
-        return base64.b64decode(data.encode("utf-8")).decode("utf-8")
+        try:
+            now = time.time()
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if (
+                        entry.name.endswith(".parquet")
+                        and now - entry.stat().st_mtime >= HISTORICAL_CACHE_TTL
+                    ):
+                        _unlink_entry(entry)
+        except OSError:
+            pass  # Missing directory or an entry removed concurrently
+
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                df.to_parquet(f)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except (OSError, ValueError, TypeError, NotImplementedError):
+            pass  # Caching is best effort; e.g. non-string column names
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def get_complete_list(self) -> Dict:
         """Fetch the complete list of all India stations and cities.
 
+        A successful response is cached for ``STATION_LIST_TTL`` seconds, so
+        listing states, cities and stations in turn costs a single request.
+
         Returns:
             Dictionary containing station and city data.
 
@@ -72,17 +210,24 @@ class CPCBHistorical:
             requests.RequestException: If the HTTP request fails.
             json.JSONDecodeError: If response cannot be parsed as JSON.
         """
-        form_body = self._encode_base64(b"{}")
-        response = requests.post(
+        if (
+            self._complete_list is not None
+            and time.monotonic() - self._complete_list_time < STATION_LIST_TTL
+        ):
+            return self._complete_list
+
+        form_body = _url_encode_bytes({})
+        response = self.session.post(
             f"{self.base_url}{self.dropdown_endpoint}", data=form_body, timeout=30
         )
         response.raise_for_status()
 
-        decoded_response = self._decode_base64(response.text)
-        parsed_response = json.loads(decoded_response)
+        parsed_response = decode_base64_json(response.content)
 
         if parsed_response.get("status") == "success":
-            return parsed_response.get("dropdown", {})
+            self._complete_list = parsed_response.get("dropdown", {})
+            self._complete_list_time = time.monotonic()
+            return self._complete_list
         return {}
 
     def get_state_list(self) -> List[str]:
@@ -137,6 +282,29 @@ class CPCBHistorical:
         except Exception:
             return []
 
+    def _get_station_by_id(self, station_id: str) -> Optional[Dict]:
+        """Look up a station entry by ID in the complete station list.
+
+        The ID index is built once per fetched station list instead of
+        scanning every city's stations on each lookup.
+
+        Args:
+            station_id: Station ID.
+
+        Returns:
+            Station dictionary, or None if no station has this ID.
+        """
+        complete_list = self.get_complete_list()
+        if self._stations_by_id_source is not complete_list:
+            stations_by_id: Dict[str, Dict] = {}
+            for city_stations in complete_list.get("stations", {}).values():
+                for station in city_stations:
+                    # Keep the first station listed under an ID
+                    stations_by_id.setdefault(station.get("value"), station)
+            self._stations_by_id = stations_by_id
+            self._stations_by_id_source = complete_list
+        return self._stations_by_id.get(station_id)
+
     def get_file_path(
         self,
         station_id: str,
@@ -174,10 +342,9 @@ class CPCBHistorical:
             "dataType": data_type,
         }
 
-        payload_str = json.dumps(payload)
-        encoded_payload = self._encode_base64(payload_str.encode("utf-8"))
+        encoded_payload = _url_encode_bytes(payload)
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}{self.file_path_endpoint}",
             data=encoded_payload,
             headers=self.headers,
@@ -185,8 +352,7 @@ class CPCBHistorical:
         )
         response.raise_for_status()
 
-        decoded_response = self._decode_base64(response.text)
-        parsed_response = json.loads(decoded_response)
+        parsed_response = decode_base64_json(response.content)
 
         if parsed_response.get("status") == "success":
             return parsed_response.get("data", {})
@@ -213,7 +379,7 @@ class CPCBHistorical:
         for entry in data_file_paths:
             if entry.get("year") == year:
                 file_url = f"{self.base_path}{entry['filepath']}"
-                df = pd.read_excel(file_url)
+                df = self._read_excel_file(file_url, year)
                 df.to_csv(save_location, index=False)
                 return df.head()
 
@@ -235,18 +401,9 @@ class CPCBHistorical:
         Raises:
             Exception: If station or data is not found.
         """
-        complete_list = self.get_complete_list()
-        station_list = complete_list.get("stations", [])
-
         # Find station name for the given station_id
-        station_name = None
-        for city_stations in station_list.values():
-            for station in city_stations:
-                if station.get("value") == station_id:
-                    station_name = station.get("label")
-                    break
-            if station_name:
-                break
+        station = self._get_station_by_id(station_id)
+        station_name = station.get("label") if station else None
 
         if not station_name:
             raise Exception(f"Station ID {station_id} not found")
@@ -258,18 +415,53 @@ class CPCBHistorical:
         for entry in data_file_paths:
             if entry.get("year") == year:
                 file_url = f"{self.base_path}{entry['filepath']}"
-                df = pd.read_excel(file_url)
+                df = self._read_excel_file(file_url, year)
                 df.to_csv(save_location, index=False)
                 return df.head()
 
         raise Exception(f"Data not found for station {station_id} in year {year}")
 
+    def download_past_year_aqi_data_many(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        station_level: bool = False,
+        max_workers: int = 8,
+    ) -> List[pd.DataFrame]:
+        """Download past AQI data for several cities or stations concurrently.
+
+        Each download waits mostly on the CPCB server, so running them on a
+        thread pool brings the total time close to that of the slowest one.
+
+        Args:
+            jobs: (city or station ID, year, save_location) triples.
+            station_level: Whether the jobs name station IDs instead of cities.
+            max_workers: Maximum number of concurrent downloads.
+
+        Returns:
+            DataFrame previews of the downloaded data, in the order of ``jobs``.
+
+        Raises:
+            Exception: If any station or data is not found or a download fails.
+        """
+        if not jobs:
+            return []
+
+        if station_level:
+            download = self.download_past_year_aqi_data_station_level
+        else:
+            download = self.download_past_year_aqi_data_city_level
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(lambda job: download(*job), jobs))
+
 
 class CPCBLive:
     """Client for fetching live air quality data from CPCB."""
 
     def __init__(self) -> None:
         """Initialize the Live AQI Client."""
+        # Pooled keep-alive session that retries transient failures
+        self.session = get_session(DEFAULT_MAX_RETRIES, 0.3)
         self.base_url = "https://airquality.cpcb.gov.in"
         self.coordinate_url = "http://ip-api.com/json"
         self.dashboard_path = "/aqi_dashboard/"
@@ -282,13 +474,15 @@ class CPCBLive:
         }
         self.cookies = {"ccr_public": "A"}
 
-    def _make_request(self, url: str, headers: Dict, data: str, cookies: Dict) -> Dict:
+    def _make_request(
+        self, url: str, headers: Dict, data: bytes, cookies: Dict
+    ) -> Dict:
         """Make a POST request and return base64 decoded JSON response.
 
         Args:
             url: Request URL.
             headers: Request headers.
-            data: Request data.
+            data: Request body as base64 encoded JSON bytes.
             cookies: Request cookies.
 
         Returns:
@@ -298,13 +492,12 @@ class CPCBLive:
             requests.RequestException: If request fails.
             json.JSONDecodeError: If response cannot be decoded.
         """
-        response = requests.post(
+        response = self.session.post(
             url=url, headers=headers, data=data, cookies=cookies, timeout=30
         )
         response.raise_for_status()
 
-        decoded_data = base64.b64decode(response.content)
-        return json.loads(decoded_data)
+        return decode_base64_json(response.content)
 
     def _clean_pollution_data(self, data: Dict) -> Dict:
         """Clean and format pollution data.
@@ -351,7 +544,7 @@ class CPCBLive:
             Exception: If geolocation lookup fails.
         """
         try:
-            response = requests.get(self.coordinate_url, timeout=30)
+            response = self.session.get(self.coordinate_url, timeout=30)
             response.raise_for_status()
             data = response.json()
 
@@ -381,24 +574,34 @@ class CPCBLive:
             if not coords:
                 coords = self.get_system_location()
 
-            user_location = (float(coords[0]), float(coords[1]))
-            min_distance = float("inf")
-            nearest_station = None
+            user_lat, user_lon = float(coords[0]), float(coords[1])
 
+            station_refs = []
+            lats = []
+            lons = []
             for city_data in cities:
                 for station in city_data.get("stationsInCity", []):
                     try:
-                        station_location = (
-                            float(station["latitude"]),
-                            float(station["longitude"]),
-                        )
-                        distance = geodesic(user_location, station_location).kilometers
-
-                        if distance < min_distance:
-                            min_distance = distance
-                            nearest_station = (station.get("id"), station.get("name"))
+                        station_lat = float(station["latitude"])
+                        station_lon = float(station["longitude"])
                     except (TypeError, ValueError):
                         continue
+                    station_refs.append((station.get("id"), station.get("name")))
+                    lats.append(station_lat)
+                    lons.append(station_lon)
+
+            nearest_station = None
+            if station_refs and abs(user_lat) <= 90 and math.isfinite(user_lon):
+                lat_arr = np.array(lats)
+                lon_arr = np.array(lons)
+                # Skip stations with coordinates no distance can be computed for
+                valid = (np.abs(lat_arr) <= 90) & np.isfinite(lon_arr)
+                if valid.any():
+                    distances = StationDistanceIndex(
+                        lat_arr[valid], lon_arr[valid]
+                    ).query(user_lat, user_lon)
+                    nearest = int(np.flatnonzero(valid)[np.argmin(distances)])
+                    nearest_station = station_refs[nearest]
 
             if nearest_station:
                 return nearest_station
@@ -412,7 +615,7 @@ class CPCBLive:
         Returns:
             List of station dictionaries.
         """
-        body = "e30="
+        body = b"e30="  # base64 of "{}"
         try:
             response = self._make_request(
                 self.station_url, self.headers, body, self.cookies
@@ -441,8 +644,7 @@ class CPCBLive:
         if not station_id or not date_time:
             raise ValueError("Both station_id and date_time must be provided.")
 
-        raw_body = json.dumps({"station_id": station_id, "date": date_time})
-        encoded_data = base64.b64encode(raw_body.encode()).decode("utf-8")
+        encoded_data = _station_date_body(station_id, date_time)
 
         return self._make_request(
             self.parameters_url, self.headers, encoded_data, self.cookies
@@ -495,6 +697,308 @@ class CPCBLive:
         return self._clean_pollution_data(aqi_data)
 
 
+def _polygon_pixels(
+    geom, transform: Affine, inverse: Affine, shape: Tuple[int, int]
+) -> np.ndarray:
+    """Flat indices of the raster pixels touched by a geometry.
+
+    The geometry is rasterized with ``all_touched=True``, as ``rio.clip`` does,
+    but only over the window covering its bounds rather than the whole grid.
+
+    Args:
+        geom: Polygon geometry in the raster's CRS.
+        transform: Affine transform of the raster.
+        inverse: Inverse of ``transform``, mapping coordinates to pixels.
+        shape: Raster shape as (height, width).
+
+    Returns:
+        Indices into the flattened raster; empty if the geometry covers no
+        pixels or cannot be rasterized.
+    """
+    height, width = shape
+    try:
+        col_a, row_a = inverse * (geom.bounds[0], geom.bounds[1])
+        col_b, row_b = inverse * (geom.bounds[2], geom.bounds[3])
+        # Pad by a pixel so edge pixels touched by the geometry are included
+        row0 = max(math.floor(min(row_a, row_b)) - 1, 0)
+        row1 = min(math.ceil(max(row_a, row_b)) + 1, height)
+        col0 = max(math.floor(min(col_a, col_b)) - 1, 0)
+        col1 = min(math.ceil(max(col_a, col_b)) + 1, width)
+        if row0 >= row1 or col0 >= col1:
+            return np.empty(0, dtype=np.intp)
+
+        mask = geometry_mask(
+            [geom],
+            out_shape=(row1 - row0, col1 - col0),
+            transform=transform * Affine.translation(col0, row0),
+            invert=True,
+            all_touched=True,
+        )
+    except Exception:
+        return np.empty(0, dtype=np.intp)
+
+    rows, cols = np.nonzero(mask)
+    return (rows + row0) * width + (cols + col0)
+
+
+def _zonal_stats(
+    pm25: xr.DataArray, geometries, n_jobs: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """Mean, standard deviation and pixel count of PM2.5 for each geometry.
+
+    Each geometry is rasterized once (concurrently on a thread pool); the
+    statistics for all geometries are then reduced together over the pixel
+    labels. Geometries may overlap, since every geometry keeps its own pixel
+    list.
+
+    Args:
+        pm25: 2-D PM2.5 raster with spatial dims and CRS set.
+        geometries: Polygon geometries in the raster's CRS.
+        n_jobs: Maximum number of worker threads.
+
+    Returns:
+        Arrays "mean", "std" and "count" aligned with ``geometries``; mean and
+        std are NaN where a geometry covers no valid pixels.
+    """
+    if pm25.size == 0:
+        # The geometries lie outside the grid, so they cover no pixels
+        n_zones = len(geometries)
+        return {
+            "mean": np.full(n_zones, np.nan),
+            "std": np.full(n_zones, np.nan),
+            "count": np.zeros(n_zones, dtype=np.int64),
+        }
+
+    # The transform and its inverse are shared by every geometry
+    transform = pm25.rio.transform(recalc=True)
+    inverse = ~transform
+    shape = (pm25.rio.height, pm25.rio.width)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        pixels = list(
+            executor.map(
+                lambda geom: _polygon_pixels(geom, transform, inverse, shape),
+                geometries,
+            )
+        )
+
+    n_zones = len(pixels)
+    sizes = np.fromiter(map(len, pixels), dtype=np.intp, count=n_zones)
+    if not sizes.any():
+        # No geometry covers a pixel; there is nothing to gather or reduce
+        return {
+            "mean": np.full(n_zones, np.nan),
+            "std": np.full(n_zones, np.nan),
+            "count": np.zeros(n_zones, dtype=np.int64),
+        }
+
+    labels = np.repeat(np.arange(n_zones), sizes)
+    values = pm25.values.ravel()[np.concatenate(pixels)] if n_zones else np.empty(0)
+
+    mean, std, count = _label_stats(values, labels, n_zones)
+    return {"mean": mean, "std": std, "count": count}
+
+
+def _read_geojson(geojson_file: str) -> gpd.GeoDataFrame:
+    """Read a GeoJSON file with the vectorized pyogrio reader.
+
+    Args:
+        geojson_file: Path to the GeoJSON file.
+
+    Returns:
+        GeoDataFrame of the file's features.
+    """
+    return gpd.read_file(geojson_file, engine="pyogrio", use_arrow=_USE_ARROW)
+
+
+# Open PM2.5 datasets keyed by (path, mtime_ns, size), most recently used last.
+# Kept as a plain mapping so the handles can be closed when the cache is cleared.
+_PM25_DATASETS: "OrderedDict[Tuple[str, int, int], xr.Dataset]" = OrderedDict()
+_PM25_DATASETS_MAX = 4
+_PM25_DATASETS_LOCK = threading.Lock()
+
+
+def _read_pm25_file(path: str) -> xr.Dataset:
+    """Open a PM2.5 NetCDF file with the fastest available backend."""
+    if _NETCDF_ENGINE is not None:
+        try:
+            return xr.open_dataset(path, engine=_NETCDF_ENGINE, chunks=_NETCDF_CHUNKS)
+        except (OSError, ValueError):
+            pass  # not an HDF5-based file; fall back to the default engine
+    return xr.open_dataset(path, chunks=_NETCDF_CHUNKS)
+
+
+def _open_pm25_dataset(nc_file: Path) -> xr.Dataset:
+    """Open a PM2.5 NetCDF file, reusing a recently opened handle.
+
+    Recently used files stay open, so repeated queries against the same year
+    and month skip reopening the file and re-parsing its coordinates. The
+    modification time and size are part of the cache key, so a file that is
+    re-downloaded is opened afresh rather than served from a stale handle.
+    The returned dataset is shared between calls and must not be modified or
+    closed.
+
+    Args:
+        nc_file: Path to the NetCDF file.
+
+    Returns:
+        Open dataset, dask-backed when dask is installed.
+    """
+    stat = os.stat(nc_file)
+    key = (str(nc_file), stat.st_mtime_ns, stat.st_size)
+    with _PM25_DATASETS_LOCK:
+        ds = _PM25_DATASETS.get(key)
+        if ds is not None:
+            _PM25_DATASETS.move_to_end(key)
+            return ds
+
+    ds = _read_pm25_file(key[0])
+    stale = []
+    with _PM25_DATASETS_LOCK:
+        existing = _PM25_DATASETS.get(key)
+        if existing is not None:
+            # Another thread opened the same file meanwhile; keep its handle
+            stale.append(ds)
+            ds = existing
+        else:
+            # Older versions of the same file can no longer be served
+            for old_key in [k for k in _PM25_DATASETS if k[0] == key[0]]:
+                stale.append(_PM25_DATASETS.pop(old_key))
+            _PM25_DATASETS[key] = ds
+            while len(_PM25_DATASETS) > _PM25_DATASETS_MAX:
+                stale.append(_PM25_DATASETS.popitem(last=False)[1])
+    for old in stale:
+        old.close()
+    return ds
+
+
+def _close_pm25_datasets() -> None:
+    """Close every cached PM2.5 dataset and empty the cache."""
+    with _PM25_DATASETS_LOCK:
+        datasets = list(_PM25_DATASETS.values())
+        _PM25_DATASETS.clear()
+    for ds in datasets:
+        ds.close()
+
+
+def _load_pm25_subset(
+    ds: xr.Dataset, bounds: Tuple[float, float, float, float]
+) -> xr.DataArray:
+    """Load the PM2.5 raster covering a bounding box into memory.
+
+    Only the part of the grid within the bounds, plus a two-pixel margin so
+    every pixel touched by a polygon inside them is kept, is read from the
+    file before any clipping.
+
+    Args:
+        ds: Open PM2.5 NetCDF dataset.
+        bounds: Bounding box as (minx, miny, maxx, maxy) in EPSG:4326.
+
+    Returns:
+        PM2.5 raster with ascending coordinates, spatial dims and CRS set.
+
+    Raises:
+        ValueError: If the PM2.5 variable or lat/lon coordinates are missing.
+    """
+    # Check if this is the new WUSTL format or old format
+    if "PM25" in ds.variables:
+        pm25_var = "PM25"
+    elif "GWRPM25" in ds.variables:
+        pm25_var = "GWRPM25"
+    else:
+        available_vars = list(ds.variables.keys())
+        raise ValueError(
+            f"PM2.5 variable not found. Available variables: {available_vars}"
+        )
+
+    # Handle coordinate naming variations
+    if "latitude" in ds.coords and "longitude" in ds.coords:
+        lat_coord, lon_coord = "latitude", "longitude"
+    elif "lat" in ds.coords and "lon" in ds.coords:
+        lat_coord, lon_coord = "lat", "lon"
+    else:
+        raise ValueError("Could not find latitude/longitude coordinates in NetCDF file")
+
+    # Get the actual coordinate values to determine order and resolution
+    lat_vals = ds[lat_coord].values
+    lon_vals = ds[lon_coord].values
+    lat_ascending = lat_vals[0] < lat_vals[-1]
+    lon_ascending = lon_vals[0] < lon_vals[-1]
+
+    # Keep two pixels of margin so boundary pixels survive rio.clip's all_touched
+    lat_buffer = 2 * abs(lat_vals[1] - lat_vals[0]) if lat_vals.size > 1 else 0.1
+    lon_buffer = 2 * abs(lon_vals[1] - lon_vals[0]) if lon_vals.size > 1 else 0.1
+
+    if lat_ascending:
+        lat_slice = slice(bounds[1] - lat_buffer, bounds[3] + lat_buffer)
+    else:
+        lat_slice = slice(bounds[3] + lat_buffer, bounds[1] - lat_buffer)
+
+    if lon_ascending:
+        lon_slice = slice(bounds[0] - lon_buffer, bounds[2] + lon_buffer)
+    else:
+        lon_slice = slice(bounds[2] + lon_buffer, bounds[0] - lon_buffer)
+
+    # Extract the PM25 variable within the bounds and load into memory
+    pm25 = ds[pm25_var].sel({lat_coord: lat_slice, lon_coord: lon_slice}).load()
+
+    # Ensure coordinates are ascending (required by rioxarray)
+    if not lat_ascending:
+        pm25 = pm25.sortby(lat_coord)
+    if not lon_ascending:
+        pm25 = pm25.sortby(lon_coord)
+
+    # Set spatial dimensions for rioxarray
+    pm25 = pm25.rio.set_spatial_dims(x_dim=lon_coord, y_dim=lat_coord)
+    return pm25.rio.write_crs("EPSG:4326")
+
+
+def _crop_to_bounds(
+    pm25: xr.DataArray, bounds: Tuple[float, float, float, float]
+) -> Optional[xr.DataArray]:
+    """Crop a PM2.5 raster to a bounding box plus a two-pixel margin.
+
+    Args:
+        pm25: PM2.5 raster with spatial dims and CRS set.
+        bounds: Bounding box as (minx, miny, maxx, maxy) in the raster's CRS.
+
+    Returns:
+        The window of ``pm25`` covering the bounds, with spatial dims and CRS,
+        or None if the bounds lie entirely outside the raster.
+    """
+    if pm25.size == 0:
+        return None
+    inverse = ~pm25.rio.transform(recalc=True)
+    col_a, row_a = inverse * (bounds[0], bounds[1])
+    col_b, row_b = inverse * (bounds[2], bounds[3])
+    # Same margin as _load_pm25_subset, so clipping sees the same edge pixels
+    row0 = max(math.floor(min(row_a, row_b)) - 2, 0)
+    row1 = min(math.ceil(max(row_a, row_b)) + 2, pm25.rio.height)
+    col0 = max(math.floor(min(col_a, col_b)) - 2, 0)
+    col1 = min(math.ceil(max(col_a, col_b)) + 2, pm25.rio.width)
+    if row0 >= row1 or col0 >= col1:
+        return None
+    return pm25.rio.isel_window(Window(col0, row0, col1 - col0, row1 - row0))
+
+
+def _unlink_entry(entry: os.DirEntry) -> Optional[str]:
+    """Remove a directory entry's file.
+
+    Args:
+        entry: Entry of the file to remove.
+
+    Returns:
+        None on success (or if the file is already gone), otherwise a
+        message describing the failure.
+    """
+    try:
+        os.unlink(entry.path)
+    except FileNotFoundError:
+        pass  # already gone, e.g. removed by a partial rmtree
+    except Exception as e:
+        return f"{entry.name}: {e}"
+    return None
+
+
 class PM25Client:
     """Client for processing PM2.5 satellite data from NetCDF files."""
 
@@ -506,6 +1010,8 @@ class PM25Client:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Pooled keep-alive session that retries transient failures
+        self.session = get_session(DEFAULT_MAX_RETRIES, 0.3)
 
         # AWS S3 configuration for WUSTL ACAG data (Global)
         self.aws_base_url = (
@@ -581,13 +1087,16 @@ class PM25Client:
         """
         cached_path = Path(self.get_netcdf_path(year, month))
 
-        # Check if file already exists and is valid
-        if cached_path.exists() and not force_download:
-            file_size = cached_path.stat().st_size
-            if file_size > 1024 * 1024:  # At least 1MB (reasonable for NetCDF)
-                print(f"Using cached file: {cached_path}")
-                return str(cached_path)
+        # Check if file already exists and is valid, with a single stat
+        if not force_download:
+            try:
+                file_size = cached_path.stat().st_size
+            except FileNotFoundError:
+                pass  # Not cached yet
             else:
+                if file_size > 1024 * 1024:  # At least 1MB (reasonable for NetCDF)
+                    print(f"Using cached file: {cached_path}")
+                    return str(cached_path)
                 print(f"Warning: Cached file appears incomplete, re-downloading...")
 
         # Download from AWS
@@ -597,7 +1106,7 @@ class PM25Client:
         print(f"Destination: {cached_path}")
 
         try:
-            response = requests.get(aws_url, stream=True, timeout=300)
+            response = self.session.get(aws_url, stream=True, timeout=300)
             response.raise_for_status()
 
             # Ensure directory exists
@@ -606,8 +1115,9 @@ class PM25Client:
             # Get file size for progress indication
             total_size = int(response.headers.get("content-length", 0))
 
-            # Use tqdm progress bar
-            chunk_size = 8192
+            # Use tqdm progress bar; 1 MiB reads keep the per-chunk Python
+            # overhead negligible on multi-GB files
+            chunk_size = 1 << 20
             with open(cached_path, "wb") as f:
                 with tqdm(
                     total=total_size,
@@ -627,14 +1137,12 @@ class PM25Client:
             return str(cached_path)
 
         except requests.RequestException as e:
-            if cached_path.exists():
-                cached_path.unlink()  # Remove incomplete file
+            cached_path.unlink(missing_ok=True)  # Remove incomplete file
             raise requests.RequestException(
                 f"Failed to download NetCDF data: {e}"
             ) from e
         except IOError as e:
-            if cached_path.exists():
-                cached_path.unlink()  # Remove incomplete file
+            cached_path.unlink(missing_ok=True)  # Remove incomplete file
             raise IOError(f"Failed to write NetCDF file: {e}") from e
 
     def get_pm25_stats(
@@ -643,6 +1151,7 @@ class PM25Client:
         year: int,
         month: Optional[int] = None,
         group_by: Optional[str] = None,
+        n_jobs: Optional[int] = None,
     ) -> Union[Dict[str, float], pd.DataFrame]:
         """Compute PM2.5 statistics inside a polygon region from GeoJSON.
 
@@ -657,6 +1166,8 @@ class PM25Client:
                      multiple columns (e.g., 'state_name,district_name').
                      If None, aggregates entire polygon boundary.
                      If specified, aggregates by unique combinations of values.
+            n_jobs: Maximum number of worker threads used to process groups.
+                Defaults to the ThreadPoolExecutor default.
 
         Returns:
             If group_by is None: Dictionary with mean, std, min, and max PM2.5 values.
@@ -675,7 +1186,7 @@ class PM25Client:
         nc_file = self.download_netcdf_if_needed(year, month)
 
         # Read and process polygon first to get bounding box
-        gdf = gpd.read_file(geojson_file)
+        gdf = _read_geojson(geojson_file)
         gdf = gdf.to_crs("EPSG:4326")
 
         # If group_by is specified, delegate to grouped processing
@@ -690,102 +1201,43 @@ class PM25Client:
                     f"Column(s) {missing_cols} not found in GeoJSON. Available columns: {list(gdf.columns)}"
                 )
 
-            return self._get_pm25_stats_grouped(gdf, nc_file, group_cols)
+            return self._get_pm25_stats_grouped(gdf, nc_file, group_cols, n_jobs)
 
         # Otherwise, process as combined polygon
         polygon = gdf.union_all()  # Combine polygons if multiple
         bounds = polygon.bounds  # (minx, miny, maxx, maxy)
 
-        with xr.open_dataset(nc_file) as ds:
-            # Check if this is the new WUSTL format or old format
-            if "PM25" in ds.variables:
-                pm25_var = "PM25"
-            elif "GWRPM25" in ds.variables:
-                pm25_var = "GWRPM25"
-            else:
-                available_vars = list(ds.variables.keys())
-                raise ValueError(
-                    f"PM2.5 variable not found. Available variables: {available_vars}"
-                )
-
-            # Handle coordinate naming variations
-            if "latitude" in ds.coords and "longitude" in ds.coords:
-                lat_coord, lon_coord = "latitude", "longitude"
-            elif "lat" in ds.coords and "lon" in ds.coords:
-                lat_coord, lon_coord = "lat", "lon"
-            else:
-                raise ValueError(
-                    "Could not find latitude/longitude coordinates in NetCDF file"
-                )
-
-            # Add small buffer to ensure we capture the polygon
-            lat_buffer = 0.1
-            lon_buffer = 0.1
-
-            # Get the actual coordinate values to determine order
-            lat_vals = ds[lat_coord].values
-            lon_vals = ds[lon_coord].values
+        ds = _open_pm25_dataset(nc_file)
+        pm25 = _load_pm25_subset(ds, bounds)
 
-            # Determine if coordinates are ascending or descending
-            lat_ascending = lat_vals[0] < lat_vals[-1]
-            lon_ascending = lon_vals[0] < lon_vals[-1]
+        # Clip to polygon and calculate statistics
+        clipped = pm25.rio.clip([polygon], crs="EPSG:4326", all_touched=True)
 
-            if lat_ascending:
-                lat_slice = slice(bounds[1] - lat_buffer, bounds[3] + lat_buffer)
-            else:
-                lat_slice = slice(bounds[3] + lat_buffer, bounds[1] - lat_buffer)
-
-            if lon_ascending:
-                lon_slice = slice(bounds[0] - lon_buffer, bounds[2] + lon_buffer)
-            else:
-                lon_slice = slice(bounds[2] + lon_buffer, bounds[0] - lon_buffer)
-
-            ds_subset = ds.sel({lat_coord: lat_slice, lon_coord: lon_slice})
-
-            # Extract the PM25 variable
-            pm25 = ds_subset[pm25_var]
+        # Reduce in one pass, skipping NaN pixels
+        mean, std, low, high, count = _nan_stats(clipped.values)
 
-            # Load into memory
-            pm25 = pm25.load()
+        if count == 0:
+            raise ValueError("No valid PM2.5 data found within the polygon boundary")
 
-            # Ensure coordinates are ascending (required by rioxarray)
-            if not lat_ascending:
-                pm25 = pm25.sortby(lat_coord)
-            if not lon_ascending:
-                pm25 = pm25.sortby(lon_coord)
-
-            # Set spatial dimensions for rioxarray
-            pm25 = pm25.rio.set_spatial_dims(x_dim=lon_coord, y_dim=lat_coord)
-            pm25 = pm25.rio.write_crs("EPSG:4326")
-
-            # Clip to polygon and calculate statistics
-            clipped = pm25.rio.clip([polygon], crs="EPSG:4326", all_touched=True)
-
-            # Get values and filter NaN
-            values = clipped.values.flatten()
-            values = values[~np.isnan(values)]
-
-            if len(values) == 0:
-                raise ValueError(
-                    "No valid PM2.5 data found within the polygon boundary"
-                )
-
-            return {
-                "mean": float(values.mean()),
-                "std": float(values.std()),
-                "min": float(values.min()),
-                "max": float(values.max()),
-            }
+        return {"mean": mean, "std": std, "min": low, "max": high}
 
     def _get_pm25_stats_grouped(
-        self, gdf: gpd.GeoDataFrame, nc_file: Path, group_by: Union[str, List[str]]
+        self,
+        gdf: gpd.GeoDataFrame,
+        nc_file: Path,
+        group_by: Union[str, List[str]],
+        n_jobs: Optional[int] = None,
     ) -> pd.DataFrame:
         """Compute PM2.5 statistics grouped by column(s) in the GeoDataFrame.
 
+        Groups are clipped and reduced concurrently on a thread pool; each
+        worker reduces its pixels with the serial ``_nan_stats`` kernel.
+
         Args:
             gdf: GeoDataFrame with geometries (already in EPSG:4326).
             nc_file: Path to NetCDF file.
             group_by: Column name(s) to group by. Can be a string or list of strings.
+            n_jobs: Maximum number of worker threads.
 
         Returns:
             DataFrame with statistics for each unique value/combination in group_by column(s).
@@ -796,136 +1248,70 @@ class PM25Client:
         bbox = gdf.total_bounds  # [minx, miny, maxx, maxy]
 
         # Load dataset and subset to bounding box
-        with xr.open_dataset(nc_file) as ds:
-            # Check variable and coordinate names
-            if "PM25" in ds.variables:
-                pm25_var = "PM25"
-            elif "GWRPM25" in ds.variables:
-                pm25_var = "GWRPM25"
-            else:
-                available_vars = list(ds.variables.keys())
-                raise ValueError(
-                    f"PM2.5 variable not found. Available variables: {available_vars}"
-                )
-
-            if "latitude" in ds.coords and "longitude" in ds.coords:
-                lat_coord, lon_coord = "latitude", "longitude"
-            elif "lat" in ds.coords and "lon" in ds.coords:
-                lat_coord, lon_coord = "lat", "lon"
-            else:
-                raise ValueError(
-                    "Could not find latitude/longitude coordinates in NetCDF file"
-                )
-
-            # Get coordinate values to determine order
-            lat_vals = ds[lat_coord].values
-            lon_vals = ds[lon_coord].values
-            lat_ascending = lat_vals[0] < lat_vals[-1]
-            lon_ascending = lon_vals[0] < lon_vals[-1]
-
-            # Create slice with correct ordering
-            lat_buffer = 0.1
-            lon_buffer = 0.1
-
-            if lat_ascending:
-                lat_slice = slice(bbox[1] - lat_buffer, bbox[3] + lat_buffer)
-            else:
-                lat_slice = slice(bbox[3] + lat_buffer, bbox[1] - lat_buffer)
-
-            if lon_ascending:
-                lon_slice = slice(bbox[0] - lon_buffer, bbox[2] + lon_buffer)
+        ds = _open_pm25_dataset(nc_file)
+        pm25 = _load_pm25_subset(ds, bbox)
+
+        # For single column, don't use list to avoid tuple wrapping
+        groupby_arg = group_cols[0] if len(group_cols) == 1 else group_cols
+
+        def group_stats(group) -> Tuple[Dict, Optional[str]]:
+            group_name, group_gdf = group
+            # Create result dict with group columns
+            result = {}
+            if len(group_cols) == 1:
+                # Single column grouping - group_name is a scalar
+                result[group_cols[0]] = group_name
             else:
-                lon_slice = slice(bbox[2] + lon_buffer, bbox[0] - lon_buffer)
-
-            ds_subset = ds.sel({lat_coord: lat_slice, lon_coord: lon_slice})
-
-            # Extract PM25 variable
-            pm25 = ds_subset[pm25_var]
-            pm25 = pm25.load()
-
-            # Ensure coordinates are ascending
-            if not lat_ascending:
-                pm25 = pm25.sortby(lat_coord)
-            if not lon_ascending:
-                pm25 = pm25.sortby(lon_coord)
-
-            # Set spatial dimensions for rioxarray
-            pm25 = pm25.rio.set_spatial_dims(x_dim=lon_coord, y_dim=lat_coord)
-            pm25 = pm25.rio.write_crs("EPSG:4326")
-
-            # Group by the specified column(s) and process each group
-            results = []
-            # For single column, don't use list to avoid tuple wrapping
-            groupby_arg = group_cols[0] if len(group_cols) == 1 else group_cols
-
-            for group_name, group_gdf in gdf.groupby(groupby_arg):
-                # Combine all polygons in this group
+                # Multiple column grouping - group_name is a tuple
+                for i, col in enumerate(group_cols):
+                    result[col] = group_name[i]
+
+            mean = std = low = high = np.nan
+            count = 0
+            error = None
+            try:
+                # Clip to the combined geometry of all polygons in this group,
+                # rasterizing only over the group's own window
                 combined_geom = group_gdf.union_all()
-
-                try:
-                    # Clip to the combined geometry
-                    clipped = pm25.rio.clip(
+                window = _crop_to_bounds(pm25, combined_geom.bounds)
+                # A group outside the raster covers no pixels; skip clipping
+                if window is not None:
+                    clipped = window.rio.clip(
                         [combined_geom], crs="EPSG:4326", all_touched=True
                     )
 
-                    # Get values and filter NaN
-                    values = clipped.values.flatten()
-                    values = values[~np.isnan(values)]
-
-                    # Create result dict with group columns
-                    result = {}
-                    if len(group_cols) == 1:
-                        # Single column grouping - group_name is a scalar
-                        result[group_cols[0]] = group_name
-                    else:
-                        # Multiple column grouping - group_name is a tuple
-                        for i, col in enumerate(group_cols):
-                            result[col] = group_name[i]
-
-                    # Add statistics
-                    if len(values) > 0:
-                        result.update(
-                            {
-                                "mean": float(values.mean()),
-                                "std": float(values.std()),
-                                "min": float(values.min()),
-                                "max": float(values.max()),
-                                "count": len(values),
-                            }
-                        )
-                    else:
-                        result.update(
-                            {
-                                "mean": np.nan,
-                                "std": np.nan,
-                                "min": np.nan,
-                                "max": np.nan,
-                                "count": 0,
-                            }
-                        )
-
-                    results.append(result)
-
-                except Exception as e:
-                    print(f"Warning: Error processing group '{group_name}': {e}")
-                    result = {}
-                    if len(group_cols) == 1:
-                        result[group_cols[0]] = group_name
-                    else:
-                        for i, col in enumerate(group_cols):
-                            result[col] = group_name[i]
-                    result.update(
-                        {
-                            "mean": np.nan,
-                            "std": np.nan,
-                            "min": np.nan,
-                            "max": np.nan,
-                            "count": 0,
-                        }
-                    )
-                    results.append(result)
+                    # Reduce in one pass, skipping NaN pixels
+                    mean, std, low, high, count = _nan_stats(clipped.values)
+            except Exception as e:
+                mean = std = low = high = np.nan
+                count = 0
+                error = f"'{group_name}': {e}"
 
-            return pd.DataFrame(results)
+            # Add statistics (NaN when the group covers no valid pixels)
+            result.update(
+                {"mean": mean, "std": std, "min": low, "max": high, "count": count}
+            )
+            return result, error
+
+        # Groups are independent; clipping and reducing release the GIL.
+        # Workers must stick to serial numba kernels such as _nan_stats':
+        # parallel kernels abort when launched from several threads at once
+        # under numba's default threading layer, and would oversubscribe the
+        # CPU (pool threads x numba threads) under TBB or OpenMP
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            outcomes = list(executor.map(group_stats, gdf.groupby(groupby_arg)))
+
+        results = [result for result, _ in outcomes]
+        # Reported once after the groups are processed to keep I/O out of them
+        failed = [error for _, error in outcomes if error is not None]
+
+        if failed:
+            print(
+                f"Warning: Error processing {len(failed)} group(s): "
+                + "; ".join(failed)
+            )
+
+        return pd.DataFrame(results)
 
     def get_pm25_stats_by_polygon(
         self,
@@ -933,17 +1319,25 @@ class PM25Client:
         year: int,
         month: Optional[int] = None,
         id_field: Optional[str] = None,
+        n_jobs: Optional[int] = None,
     ) -> pd.DataFrame:
         """Compute PM2.5 statistics for each polygon in GeoJSON file.
 
+        Each polygon is rasterized over its own bounding window, concurrently
+        on a thread pool, and the statistics for all polygons are reduced in
+        one pass.
+
         Args:
             geojson_file: Path to GeoJSON file with polygons.
             year: Year of the NetCDF data.
             month: Optional month of the NetCDF data.
             id_field: Optional field in GeoJSON properties to use as identifier.
+            n_jobs: Maximum number of worker threads. Defaults to the
+                ThreadPoolExecutor default.
 
         Returns:
-            DataFrame with statistics for each polygon.
+            DataFrame with statistics for each polygon. String identifiers
+            are returned as a categorical column.
 
         Raises:
             FileNotFoundError: If NetCDF or GeoJSON file not found.
@@ -958,125 +1352,84 @@ class PM25Client:
         nc_file = self.download_netcdf_if_needed(year, month)
 
         # Read GeoJSON and get overall bounding box first
-        gdf = gpd.read_file(geojson_file)
+        gdf = _read_geojson(geojson_file)
         gdf = gdf.to_crs("EPSG:4326")
         bbox = gdf.total_bounds  # [minx, miny, maxx, maxy]
 
-        with xr.open_dataset(nc_file) as ds:
-            # Check if this is the new WUSTL format or old format
-            if "PM25" in ds.variables:
-                pm25_var = "PM25"
-            elif "GWRPM25" in ds.variables:
-                pm25_var = "GWRPM25"
-            else:
-                available_vars = list(ds.variables.keys())
-                raise ValueError(
-                    f"PM2.5 variable not found. Available variables: {available_vars}"
-                )
+        ds = _open_pm25_dataset(nc_file)
+        pm25 = _load_pm25_subset(ds, bbox)
 
-            # Handle coordinate naming variations
-            if "latitude" in ds.coords and "longitude" in ds.coords:
-                lat_coord, lon_coord = "latitude", "longitude"
-            elif "lat" in ds.coords and "lon" in ds.coords:
-                lat_coord, lon_coord = "lat", "lon"
-            else:
-                raise ValueError(
-                    "Could not find latitude/longitude coordinates in NetCDF file"
-                )
-
-            lat_buffer = 0.1
-            lon_buffer = 0.1
+        # Determine column name once at the beginning
+        if id_field and id_field in gdf.columns:
+            column_name = id_field
+        elif "NAME_1" in gdf.columns:
+            column_name = "NAME_1"
+        elif "name" in gdf.columns:
+            column_name = "name"
+        else:
+            column_name = "index"
 
-            lat_vals = ds[lat_coord].values
-            lon_vals = ds[lon_coord].values
-            lat_ascending = lat_vals[0] < lat_vals[-1]
-            lon_ascending = lon_vals[0] < lon_vals[-1]
+        # The geometry array avoids boxing each row as a Series
+        stats = _zonal_stats(pm25, gdf.geometry.values, n_jobs=n_jobs)
 
-            if lat_ascending:
-                lat_slice = slice(bbox[1] - lat_buffer, bbox[3] + lat_buffer)
-            else:
-                lat_slice = slice(bbox[3] + lat_buffer, bbox[1] - lat_buffer)
+        # Get feature identifiers based on determined column
+        if column_name == "index":
+            feature_ids = gdf.index.to_numpy()
+        elif pd.api.types.is_string_dtype(gdf[column_name]):
+            # Names such as states repeat across polygons; store each once
+            feature_ids = pd.Categorical(gdf[column_name])
+        else:
+            feature_ids = gdf[column_name].to_numpy()
 
-            if lon_ascending:
-                lon_slice = slice(bbox[0] - lon_buffer, bbox[2] + lon_buffer)
-            else:
-                lon_slice = slice(bbox[2] + lon_buffer, bbox[0] - lon_buffer)
-
-            ds_subset = ds.sel({lat_coord: lat_slice, lon_coord: lon_slice})
-
-            # Extract the PM25 variable
-            pm25 = ds_subset[pm25_var]
-            pm25 = pm25.load()
-
-            # Ensure coordinates are ascending
-            if not lat_ascending:
-                pm25 = pm25.sortby(lat_coord)
-            if not lon_ascending:
-                pm25 = pm25.sortby(lon_coord)
-
-            # Set spatial dimensions for rioxarray
-            pm25 = pm25.rio.set_spatial_dims(x_dim=lon_coord, y_dim=lat_coord)
-            pm25 = pm25.rio.write_crs("EPSG:4326")
-
-            # Determine column name once at the beginning
-            if id_field and id_field in gdf.columns:
-                column_name = id_field
-            elif "NAME_1" in gdf.columns:
-                column_name = "NAME_1"
-            elif "name" in gdf.columns:
-                column_name = "name"
-            else:
-                column_name = "index"
+        # The stats arrays are freshly computed, so the frame can adopt them
+        return pd.DataFrame(
+            {column_name: feature_ids, "mean": stats["mean"], "std": stats["std"]},
+            index=pd.RangeIndex(len(gdf)),
+            copy=False,
+        )
 
-            results = []
+    def _scan_cache_dir(self) -> Optional[List[os.DirEntry]]:
+        """List the cache directory in a single pass.
 
-            # Process each polygon
-            for idx, row in gdf.iterrows():
-                geom = row.geometry
+        A missing directory is detected by the listing itself rather than a
+        separate existence check.
 
-                try:
-                    clipped = pm25.rio.clip([geom], crs="EPSG:4326", all_touched=True)
-
-                    # Get values and filter NaN
-                    values = clipped.values.flatten()
-                    values = values[~np.isnan(values)]
-
-                    if values.size > 0:
-                        mean_val = float(values.mean())
-                        std_val = float(values.std())
-                    else:
-                        mean_val, std_val = np.nan, np.nan
-                except Exception:
-                    mean_val, std_val = np.nan, np.nan
-
-                # Get feature identifier based on determined column
-                if column_name == "index":
-                    feature_id = idx
-                else:
-                    feature_id = row[column_name]
-
-                results.append(
-                    {
-                        column_name: feature_id,
-                        "mean": mean_val,
-                        "std": std_val,
-                    }
-                )
-
-            return pd.DataFrame(results)
+        Returns:
+            Entries of the cache directory, or None if it does not exist.
+        """
+        try:
+            with os.scandir(self.cache_dir) as it:
+                return list(it)
+        except FileNotFoundError:
+            return None
 
     def clear_cache(self) -> None:
         """Clear all cached NetCDF files."""
-        if self.cache_dir.exists():
-            for file in self.cache_dir.glob("*.nc"):
-                try:
-                    file.unlink()
-                    print(f"Removed: {file}")
-                except Exception as e:
-                    print(f"Warning: Could not remove {file}: {e}")
-            print(f"Cache cleared: {self.cache_dir}")
-        else:
+        # Release the open dataset handles before their files are removed
+        _close_pm25_datasets()
+        entries = self._scan_cache_dir()
+        if entries is None:
             print("Cache directory does not exist")
+            return
+
+        files = [entry for entry in entries if entry.name.endswith(".nc")]
+
+        # Only the scanned files are removed; the directory itself is kept
+        removed = len(files)
+        failed = []
+        if files:
+            # Overlap the round trips of high-latency (network) filesystems
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+                errors = executor.map(_unlink_entry, files)
+                failed = [error for error in errors if error is not None]
+            removed -= len(failed)
+
+        # One summary instead of a line per file
+        if failed:
+            print(
+                f"Warning: Could not remove {len(failed)} file(s): " + "; ".join(failed)
+            )
+        print(f"Cache cleared ({removed} file(s) removed): {self.cache_dir}")
 
     def list_cached_files(self) -> List[str]:
         """List all cached NetCDF files.
@@ -1084,16 +1437,20 @@ class PM25Client:
         Returns:
             List of cached file paths.
         """
-        if not self.cache_dir.exists():
+        entries = self._scan_cache_dir()
+        if entries is None:
             return []
 
-        cached_files = list(self.cache_dir.glob("*.nc"))
-        if cached_files:
-            print(f"Cached files in {self.cache_dir}:")
-            for file in cached_files:
-                size_mb = file.stat().st_size / (1024 * 1024)
-                print(f"   {file.name} ({size_mb:.1f} MB)")
+        # Each entry's stat comes from the directory listing itself
+        entries = [entry for entry in entries if entry.name.endswith(".nc")]
+        if entries:
+            # Format the whole listing first and write it with one print
+            lines = [
+                f"   {entry.name} ({entry.stat().st_size / (1 << 20):.1f} MB)"
+                for entry in entries
+            ]
+            print(f"Cached files in {self.cache_dir}:\n" + "\n".join(lines))
         else:
             print(f"No cached files in {self.cache_dir}")
 
-        return [str(f) for f in cached_files]
+        return [entry.path for entry in entries]
@@ -6,16 +6,27 @@ from CPCB web services, including station data, raw data downloads, and geograph
 station lookups.
 """
 
+import hashlib
 import heapq
+import json
 import math
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from .constants import ALL_STATION_URL, DOWNLOAD_URL, POST_HEADERS
+from .constants import (
+    ALL_STATION_URL,
+    DOWNLOAD_URL,
+    ETAG_CACHE_FILENAME,
+    POST_HEADERS,
+    STATION_LIST_TTL,
+)
 from .exceptions import CPCBError, NetworkError
 from .utils import (
+    StationDistanceIndex,
     clean_station_name,
     haversine_distance,
     safe_get,
@@ -26,17 +37,66 @@ from .utils import (
 )
 
 
+def _file_matches(path: Path, size: int, digest: str) -> bool:
+    """Check that a file still has the size and SHA-256 digest recorded for it.
+
+    Args:
+        path: File to check.
+        size: Expected size in bytes.
+        digest: Expected hexadecimal SHA-256 digest.
+
+    Returns:
+        True if the file exists and matches, False otherwise.
+    """
+    try:
+        if path.stat().st_size != size:
+            return False
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha.update(block)
+    except OSError:
+        return False
+    return sha.hexdigest() == digest
+
+
+# Below this many stations a scalar loop beats NumPy's per-call overhead
+_VECTORIZE_MIN_STATIONS = 64
+
+
 class CPCBClient:
     """Main client for fetching air quality data from Central Pollution Control Board."""
 
-    def __init__(self, use_test_endpoint: bool = True) -> None:
+    def __init__(
+        self, use_test_endpoint: bool = True, cache_dir: Optional[str] = None
+    ) -> None:
         """Initialize the CPCB Client.
 
         Args:
             use_test_endpoint: Whether to use the test endpoint (unused, kept for compatibility).
+            cache_dir: Directory where the ETag/Last-Modified validators of
+                downloaded files are recorded so repeat downloads can be
+                revalidated instead of refetched. None (the default) disables
+                conditional downloads.
         """
         self.station_url = ALL_STATION_URL
         self.cookies = {"ccr_public": "A"}
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        # URL -> resolved file path -> [ETag, Last-Modified, size, SHA-256]
+        self._etag_cache: Optional[Dict[str, Dict[str, list]]] = None
+
+        # Station coordinates, fetched once and reused by the geographic lookups.
+        # Valid stations are flattened into parallel arrays (one entry per station)
+        # so the float conversion and validation happen once, not per query.
+        self._stations: Optional[List[Dict]] = None
+        self._stations_time = 0.0
+        self._station_records: Optional[List[Dict]] = None
+        self._station_ids: Optional[np.ndarray] = None
+        self._lats: Optional[np.ndarray] = None
+        self._lons: Optional[np.ndarray] = None
+        self._distance_index: Optional[StationDistanceIndex] = None
+        # 1-degree grid cell (floor(lat), floor(lon)) -> indices into the arrays above
+        self._grid: Optional[Dict[Tuple[int, int], np.ndarray]] = None
 
     def list_stations(
         self, as_dataframe: bool = False
@@ -53,12 +113,12 @@ class CPCBClient:
             CPCBError: If failed to fetch station data.
         """
         try:
-            data = "e30="
+            data = b"e30="  # base64 of "{}"
             response = safe_post(
                 self.station_url, headers=POST_HEADERS, data=data, cookies=self.cookies
             )
             stations = response.get("stations", [])
-            sorted_stations = sort_station_data(stations)
+            sorted_stations = sort_station_data(stations, inplace=True)
 
             if as_dataframe:
                 return stations_to_dataframe(sorted_stations)
@@ -66,15 +126,193 @@ class CPCBClient:
         except Exception as e:
             raise CPCBError(f"Failed to fetch stations: {str(e)}") from e
 
-    def _log_if_verbose(self, message: str, verbose: bool) -> None:
+    def _get_stations_cached(self) -> List[Dict]:
+        """Get the station list, fetching it again once it is stale.
+
+        The geographic lookups share one fetch, together with a grid index
+        built from it, for STATION_LIST_TTL seconds, after which the list is
+        refetched so the live status and AQI fields stay current.
+
+        Returns:
+            List of city dictionaries with nested stations.
+
+        Raises:
+            CPCBError: If failed to fetch station data.
+        """
+        if (
+            self._stations is None
+            or time.monotonic() - self._stations_time >= STATION_LIST_TTL
+        ):
+            try:
+                stations = self.list_stations()
+            except Exception as e:
+                raise CPCBError(f"Failed to fetch station data: {str(e)}") from e
+            self._build_station_index(stations)
+            self._stations = stations
+            self._stations_time = time.monotonic()
+        return self._stations
+
+    def _build_station_index(self, cities: List[Dict]) -> None:
+        """Build coordinate arrays and a 1-degree grid index of stations.
+
+        Args:
+            cities: List of city dictionaries with nested stations.
+        """
+        records = []
+        station_ids = []
+        lats = []
+        lons = []
+        cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for city in cities:
+            for station in city.get("stationsInCity", []):
+                try:
+                    station_lat = float(station["latitude"])
+                    station_lon = float(station["longitude"])
+                    station_id = station["id"]
+                except (ValueError, KeyError, TypeError):
+                    # Skip stations with invalid coordinates
+                    continue
+                if not (math.isfinite(station_lat) and math.isfinite(station_lon)):
+                    # "nan"/"inf" parse as floats but match no distance
+                    continue
+
+                cell = (math.floor(station_lat), math.floor(station_lon))
+                cells.setdefault(cell, []).append(len(station_ids))
+                records.append(station)
+                station_ids.append(station_id)
+                lats.append(station_lat)
+                lons.append(station_lon)
+
+        self._station_records = records
+        self._station_ids = np.array(station_ids, dtype=object)
+        self._lats = np.array(lats, dtype=np.float64)
+        self._lons = np.array(lons, dtype=np.float64)
+        self._distance_index = StationDistanceIndex(self._lats, self._lons)
+        self._grid = {
+            cell: np.array(indices, dtype=np.intp) for cell, indices in cells.items()
+        }
+
+    def _grid_candidates(
+        self, target_lat: float, target_lon: float, max_distance_km: float
+    ) -> np.ndarray:
+        """Get indices of stations in grid cells that may lie within a radius.
+
+        Args:
+            target_lat: Target latitude.
+            target_lon: Target longitude.
+            max_distance_km: Search radius in kilometers.
+
+        Returns:
+            Array of indices into the station coordinate arrays.
+        """
+        # 1 degree latitude ≈ 111 km; use the widest latitude in range for the
+        # longitude span so the cells cover the whole search circle
+        lat_span = max_distance_km / 111.0
+        widest_lat = min(abs(target_lat) + lat_span, 89.0)
+        lon_span = max_distance_km / (111.0 * math.cos(math.radians(widest_lat)))
+
+        min_lat_cell = math.floor(target_lat - lat_span)
+        max_lat_cell = math.floor(target_lat + lat_span)
+        min_lon_cell = math.floor(target_lon - lon_span)
+        max_lon_cell = math.floor(target_lon + lon_span)
+
+        n_cells = (max_lat_cell - min_lat_cell + 1) * (max_lon_cell - min_lon_cell + 1)
+        if n_cells <= len(self._grid):
+            # Probe only the neighbouring cells
+            matches = [
+                self._grid[(lat_cell, lon_cell)]
+                for lat_cell in range(min_lat_cell, max_lat_cell + 1)
+                for lon_cell in range(min_lon_cell, max_lon_cell + 1)
+                if (lat_cell, lon_cell) in self._grid
+            ]
+        else:
+            # Large radius: cheaper to filter the occupied cells
+            matches = [
+                indices
+                for (lat_cell, lon_cell), indices in self._grid.items()
+                if min_lat_cell <= lat_cell <= max_lat_cell
+                and min_lon_cell <= lon_cell <= max_lon_cell
+            ]
+
+        if not matches:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(matches)
+
+    def _log_if_verbose(self, message: str, verbose: bool, *args) -> None:
         """Print message only if verbose mode is enabled.
 
         Args:
-            message: Message to print.
+            message: Message to print, optionally with %-style placeholders.
             verbose: Whether verbose mode is enabled.
+            *args: Placeholder values; formatted only when the message is printed.
         """
         if verbose:
-            print(message)
+            print(message % args if args else message)
+
+    def _get_etag_cache(self) -> Dict[str, Dict[str, list]]:
+        """Get the conditional-request validators of previously downloaded files.
+
+        The validators are loaded from the cache directory on first use.
+
+        Returns:
+            Dictionary mapping URL to a dictionary that maps the resolved path
+            of the saved file to its [ETag, Last-Modified, size, SHA-256].
+        """
+        if self._etag_cache is None:
+            cache: Dict[str, Dict[str, list]] = {}
+            try:
+                with open(self.cache_dir / ETAG_CACHE_FILENAME, "r") as f:
+                    cache = {
+                        url: {path: list(entry) for path, entry in paths.items()}
+                        for url, paths in json.load(f).items()
+                    }
+            except (OSError, ValueError, TypeError, AttributeError):
+                pass
+            self._etag_cache = cache
+        return self._etag_cache
+
+    def _save_etag_cache(self) -> None:
+        """Persist the conditional-request validators to the cache directory."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_dir / ETAG_CACHE_FILENAME, "w") as f:
+                json.dump(self._get_etag_cache(), f, indent=2)
+        except OSError:
+            # The cache is an optimization only; a failed write is not fatal
+            pass
+
+    def _remember_validators(
+        self, url: str, file_path: Path, response, content: bytes
+    ) -> None:
+        """Record the validators of a freshly downloaded file.
+
+        Any other file previously recorded at the same path is forgotten, since
+        its content has just been overwritten.
+
+        Args:
+            url: URL the file was downloaded from.
+            file_path: Path the content was saved to.
+            response: HTTP response the content came from.
+            content: Content written to ``file_path``.
+        """
+        etag_cache = self._get_etag_cache()
+        file_key = str(file_path.resolve())
+        for paths in etag_cache.values():
+            paths.pop(file_key, None)
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if etag or last_modified:
+            digest = hashlib.sha256(content).hexdigest()
+            etag_cache.setdefault(url, {})[file_key] = [
+                etag,
+                last_modified,
+                len(content),
+                digest,
+            ]
+        for stale_url in [u for u, paths in etag_cache.items() if not paths]:
+            del etag_cache[stale_url]
+        self._save_etag_cache()
 
     def _generate_filename(
         self,
@@ -132,6 +370,12 @@ class CPCBClient:
     ) -> Union[str, pd.DataFrame, None]:
         """Download CSV file from CPCB data repository.
 
+        If the client has a ``cache_dir`` and the same URL was downloaded to the
+        same file before, the request is made conditional on the server's
+        ETag/Last-Modified validators and the existing file is reused when the
+        server answers 304 Not Modified. The file is only trusted if its size
+        and SHA-256 digest still match the downloaded content.
+
         Args:
             url: Direct URL to download from (if provided, other parameters are ignored).
             site_id: Station site ID (required if url not provided).
@@ -176,51 +420,73 @@ class CPCBClient:
             cleaned_station_name = clean_station_name(station_name)
             csv_filename = f"{site_id}_{cleaned_station_name}_{time_period}.csv"
             url = f"{DOWNLOAD_URL}/{time_period}/{year}/{csv_filename}"
-            self._log_if_verbose(f"Constructed URL: {url}", verbose)
+            self._log_if_verbose("Constructed URL: %s", verbose, url)
 
-        self._log_if_verbose(f"Downloading CSV from: {url}", verbose)
+        self._log_if_verbose("Downloading CSV from: %s", verbose, url)
 
         try:
+            # Generate filename and file path
+            generated_filename = self._generate_filename(
+                url, site_id, station_name, time_period, year or "", filename
+            )
+            output_path = Path(output_dir)
+            file_path = output_path / generated_filename
+
+            # Revalidate a previously downloaded copy instead of refetching it
+            request_headers = {}
+            if self.cache_dir is not None:
+                etag_cache = self._get_etag_cache()
+                file_key = str(file_path.resolve())
+                entry = etag_cache.get(url, {}).get(file_key)
+                if entry is not None and _file_matches(file_path, *entry[2:]):
+                    etag, last_modified = entry[:2]
+                    if etag:
+                        request_headers["If-None-Match"] = etag
+                    if last_modified:
+                        request_headers["If-Modified-Since"] = last_modified
+
             # Make the request with longer timeout for file downloads
-            response = safe_get(url, timeout=60, max_retries=3)
+            response = safe_get(url, timeout=60, max_retries=3, headers=request_headers)
 
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            if (
-                "text/csv" not in content_type
-                and "application/octet-stream" not in content_type
-            ):
+            if response.status_code == 304:
                 self._log_if_verbose(
-                    f"Warning: Unexpected content type: {content_type}", verbose
+                    "Not modified, using existing file: %s", verbose, file_path
                 )
+            else:
+                # Check content type
+                content_type = response.headers.get("content-type", "").lower()
+                if (
+                    "text/csv" not in content_type
+                    and "application/octet-stream" not in content_type
+                ):
+                    self._log_if_verbose(
+                        "Warning: Unexpected content type: %s", verbose, content_type
+                    )
 
-            # Generate filename
-            generated_filename = self._generate_filename(
-                url, site_id, station_name, time_period, year or "", filename
-            )
-
-            # Create output directory and file path
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-            file_path = Path(output_dir) / generated_filename
+                # Create output directory and write file
+                output_path.mkdir(parents=True, exist_ok=True)
+                self._log_if_verbose("Saving to: %s", verbose, file_path)
+                content = response.content
+                with open(file_path, "wb") as f:
+                    f.write(content)
 
-            # Write file
-            self._log_if_verbose(f"Saving to: {file_path}", verbose)
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+                self._log_if_verbose("Successfully downloaded: %s", verbose, file_path)
 
-            self._log_if_verbose(f"Successfully downloaded: {file_path}", verbose)
+                # Remember validators so the next call can be conditional
+                if self.cache_dir is not None:
+                    self._remember_validators(url, file_path, response, content)
 
             # Return DataFrame if requested
             if return_dataframe:
                 try:
                     df = pd.read_csv(file_path)
                     self._log_if_verbose(
-                        f"Loaded DataFrame with shape: {df.shape}", verbose
+                        "Loaded DataFrame with shape: %s", verbose, df.shape
                     )
                     return df
                 except Exception as e:
                     self._log_if_verbose(
-                        f"Failed to load CSV as DataFrame: {e}", verbose
+                        "Failed to load CSV as DataFrame: %s", verbose, e
                     )
                     if verbose:
                         print(f"File saved at: {file_path}")
@@ -238,6 +504,8 @@ class CPCBClient:
     ) -> Union[str, Tuple[str, float]]:
         """Find the nearest station to given coordinates using optimized algorithms.
 
+        Station coordinates are fetched once per client and reused across calls.
+
         Args:
             lat: Target latitude.
             lon: Target longitude.
@@ -249,37 +517,35 @@ class CPCBClient:
         Raises:
             CPCBError: If failed to fetch station data or no stations available.
         """
-        try:
-            cities = self.list_stations()
-        except Exception as e:
-            raise CPCBError(f"Failed to fetch station data: {str(e)}") from e
-
-        if not cities:
+        if not self._get_stations_cached():
             raise CPCBError("No stations available")
 
         target_lat, target_lon = float(lat), float(lon)
         min_distance = float("inf")
         nearest_station_id = None
 
-        # Single pass through all stations
-        for city in cities:
-            for station in city.get("stationsInCity", []):
-                try:
-                    station_lat = float(station["latitude"])
-                    station_lon = float(station["longitude"])
-
-                    # Use haversine distance for accurate geographical distance
-                    distance = haversine_distance(
-                        target_lat, target_lon, station_lat, station_lon
-                    )
+        if len(self._lats) < _VECTORIZE_MIN_STATIONS:
+            # Single pass through all stations
+            for station_id, station_lat, station_lon in zip(
+                self._station_ids, self._lats.tolist(), self._lons.tolist()
+            ):
+                # Use haversine distance for accurate geographical distance
+                distance = haversine_distance(
+                    target_lat, target_lon, station_lat, station_lon
+                )
 
-                    if distance < min_distance:
-                        min_distance = distance
-                        nearest_station_id = station["id"]
-
-                except (ValueError, KeyError, TypeError):
-                    # Skip stations with invalid coordinates
-                    continue
+                if distance < min_distance:
+                    min_distance = distance
+                    nearest_station_id = station_id
+        else:
+            # Vectorized distances to every station at once
+            distances = self._distance_index.query(target_lat, target_lon)
+            nearest_index = int(np.argmin(distances))
+            # A non-finite target yields NaN everywhere; like the scalar loop,
+            # that matches no station
+            if np.isfinite(distances[nearest_index]):
+                min_distance = float(distances[nearest_index])
+                nearest_station_id = self._station_ids[nearest_index]
 
         if nearest_station_id is None:
             raise CPCBError("No valid stations found")
@@ -305,12 +571,7 @@ class CPCBClient:
         Raises:
             CPCBError: If failed to fetch station data or no stations available.
         """
-        try:
-            cities = self.list_stations()
-        except Exception as e:
-            raise CPCBError(f"Failed to fetch station data: {str(e)}") from e
-
-        if not cities:
+        if not self._get_stations_cached():
             raise CPCBError("No stations available")
 
         target_lat, target_lon = float(lat), float(lon)
@@ -318,32 +579,26 @@ class CPCBClient:
         # Use a min-heap to efficiently track k nearest stations
         heap = []
 
-        for city in cities:
-            for station in city.get("stationsInCity", []):
-                try:
-                    station_lat = float(station["latitude"])
-                    station_lon = float(station["longitude"])
-
-                    distance = haversine_distance(
-                        target_lat, target_lon, station_lat, station_lon
-                    )
-
-                    if len(heap) < k:
-                        # Heap not full, add station
-                        heapq.heappush(
-                            heap, (-distance, station["id"], distance, station)
-                        )
-                    elif distance < -heap[0][0]:
-                        # Found closer station, replace farthest
-                        heapq.heapreplace(
-                            heap, (-distance, station["id"], distance, station)
-                        )
-
-                except (ValueError, KeyError, TypeError):
-                    continue
+        for index, (station_lat, station_lon) in enumerate(
+            zip(self._lats.tolist(), self._lons.tolist())
+        ):
+            distance = haversine_distance(
+                target_lat, target_lon, station_lat, station_lon
+            )
 
-        # Extract results and sort by distance (closest first)
-        results = [(station_info, distance) for _, _, distance, station_info in heap]
+            if len(heap) < k:
+                # Heap not full, add station
+                heapq.heappush(heap, (-distance, index, distance))
+            elif distance < -heap[0][0]:
+                # Found closer station, replace farthest
+                heapq.heapreplace(heap, (-distance, index, distance))
+
+        # Extract results and sort by distance (closest first); callers get
+        # copies so changing them cannot corrupt the cached station list
+        results = [
+            (dict(self._station_records[index]), distance)
+            for _, index, distance in heap
+        ]
         return sorted(results, key=lambda x: x[1])
 
     def get_nearest_station_within_radius(
@@ -351,6 +606,10 @@ class CPCBClient:
     ) -> Optional[Tuple[str, float]]:
         """Find nearest station within a specified radius.
 
+        Stations are fetched once per client and bucketed into a 1-degree grid,
+        so repeated queries only scan the cells around the target, and a cheap
+        equirectangular bound skips the haversine for stations that cannot win.
+
         Args:
             lat: Target latitude.
             lon: Target longitude.
@@ -362,49 +621,39 @@ class CPCBClient:
         Raises:
             CPCBError: If failed to fetch station data.
         """
-        try:
-            cities = self.list_stations()
-        except Exception as e:
-            raise CPCBError(f"Failed to fetch station data: {str(e)}") from e
+        self._get_stations_cached()
 
         target_lat, target_lon = float(lat), float(lon)
 
-        # Calculate bounding box for optimization
-        # 1 degree latitude ≈ 111 km
-        # 1 degree longitude ≈ 111 km * cos(latitude)
-        lat_delta = max_distance_km / 111.0
-        lon_delta = max_distance_km / (111.0 * math.cos(math.radians(target_lat)))
-
-        min_lat = target_lat - lat_delta
-        max_lat = target_lat + lat_delta
-        min_lon = target_lon - lon_delta
-        max_lon = target_lon + lon_delta
+        # Equirectangular lower bound on the great-circle distance: scaling
+        # longitude by the smallest cos(latitude) the search band can reach
+        # (plus a margin for the great circle's poleward bulge) never
+        # overestimates, so it can reject stations with one multiply-add and
+        # only plausible winners pay for the exact haversine.
+        km_per_degree = 6371.0 * math.pi / 180.0
+        widest_lat = min(abs(target_lat) + max_distance_km / 111.0 + 0.5, 90.0)
+        lon_scale = math.cos(math.radians(widest_lat))
 
         min_distance = float("inf")
         nearest_station = None
 
-        for city in cities:
-            for station in city.get("stationsInCity", []):
-                try:
-                    station_lat = float(station["latitude"])
-                    station_lon = float(station["longitude"])
-
-                    # Quick bounding box check for optimization
-                    if not (
-                        min_lat <= station_lat <= max_lat
-                        and min_lon <= station_lon <= max_lon
-                    ):
-                        continue
+        # Only stations in grid cells overlapping the search radius are scanned
+        for index in self._grid_candidates(target_lat, target_lon, max_distance_km):
+            station_lat = float(self._lats[index])
+            station_lon = float(self._lons[index])
 
-                    distance = haversine_distance(
-                        target_lat, target_lon, station_lat, station_lon
-                    )
+            dlat = station_lat - target_lat
+            dlon = (station_lon - target_lon) * lon_scale
+            bound = min(max_distance_km, min_distance) / km_per_degree
+            if dlat * dlat + dlon * dlon > bound * bound:
+                continue
 
-                    if distance <= max_distance_km and distance < min_distance:
-                        min_distance = distance
-                        nearest_station = (station["id"], distance)
+            distance = haversine_distance(
+                target_lat, target_lon, station_lat, station_lon
+            )
 
-                except (ValueError, KeyError, TypeError):
-                    continue
+            if distance <= max_distance_km and distance < min_distance:
+                min_distance = distance
+                nearest_station = (self._station_ids[index], distance)
 
         return nearest_station
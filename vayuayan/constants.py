@@ -21,6 +21,10 @@ ALL_PARAMETERS_URL = f"{BASE_URL}/aqi_dashboard/aqi_all_Parameters"
 DEFAULT_TIMEOUT: int = 10
 DEFAULT_MAX_RETRIES: int = 3
 DEFAULT_BACKOFF_FACTOR: float = 1.0
+DEFAULT_POOL_MAXSIZE: int = 32
+RETRY_STATUS_CODES: List[int] = [429, 500, 502, 503, 504]
+# Seconds the all-India station list is reused before it is fetched again
+STATION_LIST_TTL: int = 3600
 
 # HTTP Headers
 DEFAULT_HEADERS: Dict[str, str] = {
@@ -98,4 +102,8 @@ SUPPORTED_FILE_EXTENSIONS: List[str] = [".csv", ".xlsx", ".xls", ".json"]
 
 # Default File Paths
 DEFAULT_DOWNLOAD_DIR: str = "downloads"
+ETAG_CACHE_FILENAME: str = "etag_cache.json"
+HISTORICAL_CACHE_DIR: str = "~/.vayuayan_cache"
+# Seconds a cached historical data file is reused before it is downloaded again
+HISTORICAL_CACHE_TTL: int = 7 * 24 * 3600
 DEFAULT_CONFIG_DIR: str = ".cpcbfetch"
@@ -5,40 +5,128 @@ This module provides utilities for data cleaning, network requests, date parsing
 station data conversion, and analysis functions.
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import math
 import re
 import ssl
 import time
 from base64 import b64decode, b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from http.cookiejar import DefaultCookiePolicy
+from math import asin, cos, radians, sin, sqrt
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
 
 import numpy as np
 import pandas as pd
 import requests
-import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .constants import (
+    AQI_CATEGORIES,
     DATE_FORMATS,
     DEFAULT_BACKOFF_FACTOR,
     DEFAULT_HEADERS,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_MAXSIZE,
     DEFAULT_TIMEOUT,
     MONTH_ABBREV,
+    MONTHS,
+    RETRY_STATUS_CODES,
 )
-from .exceptions import NetworkError
+from .exceptions import DataProcessingError, NetworkError
 
-# Disable SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
+try:
+    import numba
+except ImportError:  # numba is an optional speedup
+    numba = None
 
-class DataProcessingError(Exception):
-    """Custom exception for data processing errors."""
+try:
+    import httpx
+except ImportError:  # httpx is only needed for the async helpers
+    httpx = None
 
-    pass
+
+@functools.lru_cache(maxsize=None)
+def get_session(
+    max_retries: int = 0, backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+) -> requests.Session:
+    """Return the pooled session for a retry configuration, creating it once.
+
+    GET, HEAD and POST requests on the session retry connection errors, read
+    errors and retryable status codes with exponential backoff, honouring
+    ``Retry-After``. Cookies set by servers are not persisted, so every call
+    only sends the cookies it is given, exactly as with the module-level
+    ``requests`` API. Connections are kept alive in the pools and reused
+    across calls.
+
+    Args:
+        max_retries: Number of retries the mounted adapters perform.
+        backoff_factor: Backoff factor for exponential retry delay.
+
+    Returns:
+        Session with keep-alive connection pools mounted for HTTP and HTTPS.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    retries = Retry(
+        total=max_retries,
+        other=0,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET", "HEAD", "POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=DEFAULT_POOL_MAXSIZE,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Pooled connections stay open between calls and are released at exit
+    atexit.register(session.close)
+    return session
+
+
+# Precompiled patterns for the text-cleaning helpers
+_RE_DASH = re.compile(r"\s*-\s*")
+_RE_NONWORD = re.compile(r"[^\w\s]")
+_RE_WS = re.compile(r"\s+")
+_RE_MULTI_US = re.compile(r"_+")
+_RE_PAREN = re.compile(r"\s*\([^)]*\)")
+_RE_AFFIX = re.compile(
+    r"^(?:For|Weather|Report|Forecast):\s*|\s*(?:Weather|Report|Forecast)$",
+    re.IGNORECASE,
+)
+_RE_HTML = re.compile(r"[<>]")
+_RE_DATE_NOISE = re.compile(r"[^\w\s\/\-,:]")
+
+# Station-name punctuation in one str.translate pass: dots are dropped, every
+# other ASCII character that is neither a word character nor whitespace
+# becomes a space
+_PUNCT_TABLE = str.maketrans(
+    {chr(code): " " for code in range(128) if _RE_NONWORD.match(chr(code))}
+)
+_PUNCT_TABLE[ord(".")] = None
+
+# Bytes that base64 decoding ignores, stripped before streamed decoding
+_B64_DISCARD = bytes(
+    code
+    for code in range(256)
+    if not (chr(code).isascii() and (chr(code).isalnum() or chr(code) in "+/="))
+)
 
 
 def clean_station_name(station_name: str) -> str:
@@ -68,27 +156,25 @@ def clean_station_name(station_name: str) -> str:
 
     cleaned = station_name.strip()
 
-    # Handle "City - Organization" pattern
-    cleaned = re.sub(r"\s*-\s*", " ", cleaned)
-    # Remove commas and replace with space
-    cleaned = re.sub(r",\s*", " ", cleaned)
-    # Remove dots but keep the text
-    cleaned = re.sub(r"\.", "", cleaned)
-    # Remove other punctuation and special characters
-    cleaned = re.sub(r"[^\w\s]", " ", cleaned)
+    # Remove dots but keep the text; replace dashes ("City - Organization"),
+    # commas and other punctuation with spaces
+    cleaned = cleaned.translate(_PUNCT_TABLE)
+    if not cleaned.isascii():
+        # Non-ASCII punctuation and special characters
+        cleaned = _RE_NONWORD.sub(" ", cleaned)
     # Replace multiple whitespace with single space
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = _RE_WS.sub(" ", cleaned)
     # Replace spaces with underscores
     cleaned = cleaned.replace(" ", "_")
     # Remove multiple consecutive underscores
-    cleaned = re.sub(r"_+", "_", cleaned)
+    cleaned = _RE_MULTI_US.sub("_", cleaned)
     # Remove leading and trailing underscores
     cleaned = cleaned.strip("_")
 
     return cleaned
 
 
-def sort_station_data(data: List[Dict]) -> List[Dict]:
+def sort_station_data(data: List[Dict], inplace: bool = False) -> List[Dict]:
     """Sort station data by live status and city name.
 
     For each city, stations are sorted by:
@@ -97,6 +183,8 @@ def sort_station_data(data: List[Dict]) -> List[Dict]:
 
     Args:
         data: List of cities with nested stations from CPCB API.
+        inplace: Whether to sort ``data`` and the station lists in place
+            instead of building new lists.
 
     Returns:
         Sorted list with the same structure but ordered by live status and city name.
@@ -114,19 +202,26 @@ def sort_station_data(data: List[Dict]) -> List[Dict]:
         # Return tuple for sorting: (live_percentage desc, city_name asc)
         return (-live_percentage, city_dict.get("cityName", "").lower())
 
+    def get_station_priority(station: Dict) -> Tuple[bool, str]:
+        """Sort key for stations: live first, then by name."""
+        return (not station.get("live", False), station.get("name", ""))
+
     # Sort the cities
-    sorted_data = sorted(data, key=get_live_status_priority)
+    if inplace:
+        data.sort(key=get_live_status_priority)
+        sorted_data = data
+    else:
+        sorted_data = sorted(data, key=get_live_status_priority)
 
     # Sort stations within each city by live status
     for city in sorted_data:
         if "stationsInCity" in city:
-            city["stationsInCity"] = sorted(
-                city["stationsInCity"],
-                key=lambda station: (
-                    not station.get("live", False),
-                    station.get("name", ""),
-                ),
-            )
+            if inplace:
+                city["stationsInCity"].sort(key=get_station_priority)
+            else:
+                city["stationsInCity"] = sorted(
+                    city["stationsInCity"], key=get_station_priority
+                )
 
     return sorted_data
 
@@ -156,6 +251,237 @@ def get_aqi_category(aqi_value: float) -> str:
         return "Severe"
 
 
+# Source field -> output column of stations_to_dataframe, in output order
+_CITY_FIELDS: Dict[str, str] = {
+    "cityName": "city_name",
+    "cityID": "city_id",
+    "stateID": "state_id",
+}
+_STATION_FIELDS: Dict[str, str] = {
+    "id": "station_id",
+    "name": "station_name",
+    "longitude": "longitude",
+    "latitude": "latitude",
+    "live": "live",
+    "avg": "avg_aqi",
+}
+_STATION_COLUMNS: List[str] = [*_CITY_FIELDS.values(), *_STATION_FIELDS.values()]
+
+
+# Upper AQI bound of every category but the last, as in get_aqi_category, and
+# the labels indexed by category code (0 is reserved for missing values)
+_AQI_LABELS: List[str] = list(AQI_CATEGORIES)
+_AQI_THRESHOLDS: np.ndarray = np.array(
+    [limits["max"] for limits in AQI_CATEGORIES.values()][:-1], dtype=np.float64
+)
+_AQI_CODE_LABELS: np.ndarray = np.array(["No Data", *_AQI_LABELS], dtype=object)
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _aqi_codes_kernel(
+        aqi: np.ndarray, thresholds: np.ndarray, out: np.ndarray
+    ) -> None:
+        """Write the category code of every AQI value into ``out``."""
+        for i in numba.prange(aqi.size):
+            value = aqi[i]
+            if np.isnan(value):
+                out[i] = 0
+                continue
+            code = thresholds.size + 1
+            for j in range(thresholds.size):
+                if value <= thresholds[j]:
+                    code = j + 1
+                    break
+            out[i] = code
+
+
+def _aqi_category_codes(aqi: np.ndarray) -> np.ndarray:
+    """Map AQI values to category codes indexing ``_AQI_CODE_LABELS``.
+
+    Uses a parallel numba kernel when numba is installed and a
+    ``np.searchsorted`` over the category thresholds otherwise.
+
+    Args:
+        aqi: One-dimensional float64 array of AQI values.
+
+    Returns:
+        uint8 array of category codes, 0 where the value is missing.
+    """
+    aqi = np.ascontiguousarray(aqi, dtype=np.float64)
+    if numba is not None:
+        codes = np.empty(aqi.size, dtype=np.uint8)
+        _aqi_codes_kernel(aqi, _AQI_THRESHOLDS, codes)
+        return codes
+
+    codes = np.searchsorted(_AQI_THRESHOLDS, aqi, side="left").astype(np.uint8) + 1
+    codes[np.isnan(aqi)] = 0
+    return codes
+
+
+if numba is not None:
+
+    # Serial: worker threads call it concurrently (see _nan_stats)
+    @numba.njit(cache=True, nogil=True)
+    def _nan_stats_kernel(values: np.ndarray) -> Tuple[float, float, float, float, int]:
+        """Mean, std, min, max and count of the non-NaN values, NaN skipped inline."""
+        total = 0.0
+        low = np.inf
+        high = -np.inf
+        count = 0
+        for i in range(values.size):
+            value = values[i]
+            if not np.isnan(value):
+                total += value
+                low = min(low, value)
+                high = max(high, value)
+                count += 1
+        if count == 0:
+            return np.nan, np.nan, np.nan, np.nan, 0
+        mean = total / count
+        # Second sweep for the deviations keeps the variance numerically stable
+        squares = 0.0
+        for i in range(values.size):
+            value = values[i]
+            if not np.isnan(value):
+                squares += (value - mean) * (value - mean)
+        return mean, np.sqrt(squares / count), low, high, count
+
+
+def _nan_stats(values: np.ndarray) -> Tuple[float, float, float, float, int]:
+    """Mean, standard deviation, minimum, maximum and count ignoring NaN.
+
+    Uses a numba kernel that skips NaN inline when numba is installed,
+    avoiding the masked copy, and NumPy reductions otherwise. The kernel is
+    serial and releases the GIL, so it is safe to call from worker threads.
+
+    Args:
+        values: Floating-point array of any shape; it is not upcast, and the
+            sums are accumulated in float64.
+
+    Returns:
+        Tuple of (mean, std, min, max, count); the statistics are NaN when
+        there are no valid values.
+    """
+    # Keep the storage dtype (typically float32) and accumulate in float64
+    values = np.asarray(values).ravel()
+    if numba is not None:
+        mean, std, low, high, count = _nan_stats_kernel(values)
+        return float(mean), float(std), float(low), float(high), int(count)
+
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return np.nan, np.nan, np.nan, np.nan, 0
+    return (
+        float(values.mean(dtype=np.float64)),
+        float(values.std(dtype=np.float64)),
+        float(values.min()),
+        float(values.max()),
+        int(values.size),
+    )
+
+
+if numba is not None:
+
+    # Parallel, so it must not be launched from several threads at once
+    @numba.njit(cache=True, parallel=True)
+    def _label_stats_kernel(
+        values: np.ndarray, labels: np.ndarray, n_labels: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-label mean, std and count of the non-NaN values."""
+        n_chunks = numba.get_num_threads()
+        step = (values.size + n_chunks - 1) // n_chunks
+        # Every chunk accumulates into its own row, so threads never collide
+        sums = np.zeros((n_chunks, n_labels))
+        counts = np.zeros((n_chunks, n_labels), dtype=np.int64)
+        for chunk in numba.prange(n_chunks):
+            for i in range(chunk * step, min(values.size, (chunk + 1) * step)):
+                value = values[i]
+                if not np.isnan(value):
+                    sums[chunk, labels[i]] += value
+                    counts[chunk, labels[i]] += 1
+
+        count = counts.sum(axis=0)
+        mean = np.full(n_labels, np.nan)
+        for label in range(n_labels):
+            if count[label] > 0:
+                mean[label] = sums[:, label].sum() / count[label]
+
+        # Second sweep for the deviations keeps the variance numerically stable
+        squares = np.zeros((n_chunks, n_labels))
+        for chunk in numba.prange(n_chunks):
+            for i in range(chunk * step, min(values.size, (chunk + 1) * step)):
+                value = values[i]
+                if not np.isnan(value):
+                    deviation = value - mean[labels[i]]
+                    squares[chunk, labels[i]] += deviation * deviation
+
+        std = np.full(n_labels, np.nan)
+        for label in range(n_labels):
+            if count[label] > 0:
+                std[label] = np.sqrt(squares[:, label].sum() / count[label])
+        return mean, std, count
+
+
+def _label_stats(
+    values: np.ndarray, labels: np.ndarray, n_labels: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Mean, standard deviation and count of values per label, ignoring NaN.
+
+    Uses a parallel numba kernel that walks the values once per sweep with
+    NaN skipped inline when numba is installed, and ``np.bincount`` over the
+    non-NaN values otherwise. Call it from one thread at a time; numba's
+    default threading layer does not support concurrent parallel launches.
+
+    Args:
+        values: One-dimensional floating-point array, typically float32; it
+            is not upcast, and the sums are accumulated in float64.
+        labels: Label in ``range(n_labels)`` of every value.
+        n_labels: Number of labels.
+
+    Returns:
+        Tuple of (mean, std, count) arrays of length ``n_labels``; mean and
+        std are NaN for labels without valid values.
+    """
+    if numba is not None:
+        return _label_stats_kernel(
+            np.ascontiguousarray(values), np.ascontiguousarray(labels), n_labels
+        )
+
+    # Drop NaN values once for all labels; bincount accumulates in float64
+    valid = ~np.isnan(values)
+    labels = labels[valid]
+    values = values[valid]
+
+    count = np.bincount(labels, minlength=n_labels)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(labels, weights=values, minlength=n_labels) / count
+        # Two-pass variance, matching numpy's std rather than E[X^2] - E[X]^2
+        deviations = values - mean[labels]
+        std = np.sqrt(
+            np.bincount(labels, weights=deviations * deviations, minlength=n_labels)
+            / count
+        )
+    return mean, std, count
+
+
+def aqi_categories(aqi_values: pd.Series) -> pd.Series:
+    """Convert a Series of AQI values to categories in one vectorized pass.
+
+    Vectorized equivalent of applying get_aqi_category to every element.
+
+    Args:
+        aqi_values: Numeric AQI values.
+
+    Returns:
+        Series of AQI category strings, "No Data" where the value is missing.
+    """
+    codes = _aqi_category_codes(aqi_values.to_numpy(dtype=np.float64, na_value=np.nan))
+    return pd.Series(
+        _AQI_CODE_LABELS[codes], index=aqi_values.index, name=aqi_values.name
+    )
+
+
 def _safe_float_conversion(value: Any, default: float = np.nan) -> float:
     """Safely convert value to float with fallback.
 
@@ -184,121 +510,153 @@ def stations_to_dataframe(data: List[Dict]) -> pd.DataFrame:
         DataFrame with columns: city_name, city_id, state_id, station_id,
                                station_name, longitude, latitude, live, avg_aqi.
     """
-    rows = []
-
+    # One list per output column, filled city by city
+    columns: Dict[str, List[Any]] = {column: [] for column in _STATION_COLUMNS}
     for city in data:
-        city_name = city.get("cityName", "")
-        city_id = city.get("cityID", "")
-        state_id = city.get("stateID", "")
-
-        for station in city.get("stationsInCity", []):
-            rows.append(
-                {
-                    "city_name": city_name,
-                    "city_id": city_id,
-                    "state_id": state_id,
-                    "station_id": station.get("id", ""),
-                    "station_name": station.get("name", ""),
-                    "longitude": _safe_float_conversion(station.get("longitude")),
-                    "latitude": _safe_float_conversion(station.get("latitude")),
-                    "live": station.get("live", False),
-                    "avg_aqi": _safe_float_conversion(station.get("avg")),
-                }
-            )
+        stations = city.get("stationsInCity")
+        if not stations:
+            continue
+        for key, column in _CITY_FIELDS.items():
+            columns[column].extend([city.get(key)] * len(stations))
+        for key, column in _STATION_FIELDS.items():
+            columns[column].extend([station.get(key) for station in stations])
+
+    if not columns["station_id"]:
+        return pd.DataFrame()
+
+    # Coerce the raw values in one vectorized pass each; empty or invalid
+    # entries become NaN without raising
+    for column in ["longitude", "latitude", "avg_aqi"]:
+        columns[column] = pd.to_numeric(
+            np.array(columns[column], dtype=object), errors="coerce"
+        ).astype(np.float64, copy=False)
+
+    df = pd.DataFrame(columns, columns=_STATION_COLUMNS)
+    text_columns = ["city_name", "city_id", "state_id", "station_id", "station_name"]
+    df[text_columns] = df[text_columns].fillna("")
+    df["live"] = df["live"].fillna(False)
+
+    return df.infer_objects()
 
-    return pd.DataFrame(rows)
+
+def _flat_stations(data: List[Dict]) -> pd.DataFrame:
+    """Flatten station data, keeping the output columns even when empty.
+
+    Args:
+        data: List of cities with nested stations.
+
+    Returns:
+        DataFrame as returned by stations_to_dataframe.
+    """
+    df = stations_to_dataframe(data)
+    if df.empty:
+        return pd.DataFrame(columns=_STATION_COLUMNS)
+    return df
 
 
 def stations_to_city_summary(data: List[Dict]) -> pd.DataFrame:
     """Convert station data to city-level summary DataFrame.
 
+    Derived from the flat station frame with per-city segment reductions, so
+    the nested data is only traversed once.
+
     Args:
         data: List of cities with nested stations.
 
     Returns:
         DataFrame with city-level aggregated statistics.
     """
-    rows = []
+    if not data:
+        return pd.DataFrame()
 
-    for city in data:
-        stations = city.get("stationsInCity", [])
-        total_stations = len(stations)
-        live_stations = sum(1 for station in stations if station.get("live", False))
-
-        # Calculate average AQI for live stations
-        live_aqi_values = [
-            _safe_float_conversion(station.get("avg"))
-            for station in stations
-            if station.get("live", False) and station.get("avg") not in ["", None]
-        ]
-        live_aqi_values = [val for val in live_aqi_values if not pd.isna(val)]
-
-        avg_aqi = np.mean(live_aqi_values) if live_aqi_values else np.nan
-        min_aqi = np.min(live_aqi_values) if live_aqi_values else np.nan
-        max_aqi = np.max(live_aqi_values) if live_aqi_values else np.nan
-
-        rows.append(
-            {
-                "city_name": city.get("cityName", ""),
-                "city_id": city.get("cityID", ""),
-                "state_id": city.get("stateID", ""),
-                "total_stations": total_stations,
-                "live_stations": live_stations,
-                "offline_stations": total_stations - live_stations,
-                "live_percentage": (
-                    (live_stations / total_stations * 100) if total_stations > 0 else 0
-                ),
-                "avg_aqi": avg_aqi,
-                "min_aqi": min_aqi,
-                "max_aqi": max_aqi,
-                "stations_with_data": len(live_aqi_values),
-            }
+    flat_df = _flat_stations(data)
+
+    # Stations of each city form one contiguous segment of the flat frame;
+    # cities without stations and repeated city entries keep their own rows
+    total = np.array(
+        [len(city.get("stationsInCity") or []) for city in data], dtype=np.int64
+    )
+    city_position = np.repeat(np.arange(len(data)), total)
+
+    live = flat_df["live"].astype(bool).to_numpy()
+    live_aqi = flat_df["avg_aqi"].where(live).to_numpy(dtype=np.float64)
+    has_data = ~np.isnan(live_aqi)
+
+    live_count = np.bincount(city_position[live], minlength=len(data))
+    with_data = np.bincount(city_position[has_data], minlength=len(data))
+
+    # NaN-skipping segment reductions; cities without AQI data stay NaN
+    avg_aqi = np.full(len(data), np.nan)
+    min_aqi = np.full(len(data), np.nan)
+    max_aqi = np.full(len(data), np.nan)
+    nonempty = total > 0
+    if nonempty.any():
+        starts = (np.cumsum(total) - total)[nonempty]
+        sums = np.add.reduceat(np.where(has_data, live_aqi, 0.0), starts)
+        counts = with_data[nonempty]
+        avg_aqi[nonempty] = np.divide(
+            sums, counts, out=np.full(len(sums), np.nan), where=counts > 0
         )
+        min_aqi[nonempty] = np.fmin.reduceat(live_aqi, starts)
+        max_aqi[nonempty] = np.fmax.reduceat(live_aqi, starts)
+
+    summary = pd.DataFrame(
+        {
+            "city_name": [city.get("cityName", "") for city in data],
+            "city_id": [city.get("cityID", "") for city in data],
+            "state_id": [city.get("stateID", "") for city in data],
+        }
+    )
+    summary["total_stations"] = total
+    summary["live_stations"] = live_count
+    summary["offline_stations"] = total - live_count
+    summary["live_percentage"] = np.divide(
+        live_count * 100.0, total, out=np.zeros(len(total)), where=total > 0
+    )
+    summary["avg_aqi"] = avg_aqi
+    summary["min_aqi"] = min_aqi
+    summary["max_aqi"] = max_aqi
+    summary["stations_with_data"] = with_data
+
+    return summary
 
-    return pd.DataFrame(rows)
+
+# Station columns kept by stations_to_coordinates_dataframe
+_COORDINATE_COLUMNS: List[str] = [
+    "station_id",
+    "station_name",
+    "city_name",
+    "state_id",
+    "longitude",
+    "latitude",
+    "live",
+    "avg_aqi",
+]
 
 
 def stations_to_coordinates_dataframe(data: List[Dict]) -> pd.DataFrame:
     """Convert station data to DataFrame optimized for mapping.
 
+    Derived from the flat station frame; stations with invalid coordinates
+    are dropped.
+
     Args:
         data: List of cities with nested stations.
 
     Returns:
         DataFrame with geographic information and essential station details.
     """
-    rows = []
+    flat_df = _flat_stations(data)
+    has_coordinates = flat_df["longitude"].notna() & flat_df["latitude"].notna()
+    if not has_coordinates.any():
+        return pd.DataFrame()
 
-    for city in data:
-        for station in city.get("stationsInCity", []):
-            try:
-                longitude = float(station["longitude"])
-                latitude = float(station["latitude"])
-                avg_aqi = _safe_float_conversion(station.get("avg"))
-
-                rows.append(
-                    {
-                        "station_id": station.get("id", ""),
-                        "station_name": station.get("name", ""),
-                        "city_name": city.get("cityName", ""),
-                        "state_id": city.get("stateID", ""),
-                        "longitude": longitude,
-                        "latitude": latitude,
-                        "live": station.get("live", False),
-                        "avg_aqi": avg_aqi,
-                        "status": "Live" if station.get("live", False) else "Offline",
-                        "aqi_category": (
-                            get_aqi_category(avg_aqi)
-                            if not pd.isna(avg_aqi)
-                            else "No Data"
-                        ),
-                    }
-                )
-            except (ValueError, TypeError, KeyError):
-                # Skip stations with invalid coordinates
-                continue
+    # Row filter and column selection in a single take
+    coords_df = flat_df.loc[has_coordinates, _COORDINATE_COLUMNS].reset_index(drop=True)
+    coords_df["status"] = np.where(coords_df["live"].astype(bool), "Live", "Offline")
+    coords_df["aqi_category"] = aqi_categories(coords_df["avg_aqi"])
 
-    return pd.DataFrame(rows)
+    return coords_df
 
 
 def convert_station_data_to_dataframe(
@@ -344,11 +702,11 @@ def analyze_station_data(data: List[Dict]) -> Dict[str, Any]:
     analysis = {
         "total_cities": len(data),
         "total_stations": len(df),
-        "live_stations": len(df[df["live"] == True]),
-        "offline_stations": len(df[df["live"] == False]),
+        "live_stations": int(df["live"].sum()),
+        "offline_stations": int((~df["live"]).sum()),
         "states": df["state_id"].nunique(),
         "unique_states": sorted(df["state_id"].unique().tolist()),
-        "stations_with_aqi_data": len(df[~pd.isna(df["avg_aqi"])]),
+        "stations_with_aqi_data": int(df["avg_aqi"].notna().sum()),
         "avg_aqi_overall": df["avg_aqi"].mean(),
         "min_aqi": df["avg_aqi"].min(),
         "max_aqi": df["avg_aqi"].max(),
@@ -359,26 +717,124 @@ def analyze_station_data(data: List[Dict]) -> Dict[str, Any]:
     }
 
     # Add AQI category distribution
-    df_with_categories = df.copy()
-    df_with_categories["aqi_category"] = df_with_categories["avg_aqi"].apply(
-        get_aqi_category
-    )
-    analysis["aqi_categories"] = (
-        df_with_categories["aqi_category"].value_counts().to_dict()
-    )
+    analysis["aqi_categories"] = aqi_categories(df["avg_aqi"]).value_counts().to_dict()
 
     return analysis
 
 
-def _log_if_verbose(message: str, verbose: bool) -> None:
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON document as bytes or string.
+
+    Returns:
+        Parsed JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable value.
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def decode_base64_json(content: bytes) -> Any:
+    """Decode a base64-encoded JSON response body.
+
+    Works on the raw response bytes, so the payload is never round-tripped
+    through ``str``; orjson parses the decoded bytes directly when installed.
+
+    Args:
+        content: Base64-encoded response body.
+
+    Returns:
+        Parsed JSON value.
+    """
+    return _json_loads(b64decode(content))
+
+
+def _decode_base64_json_stream(chunks: Iterable[bytes]) -> Any:
+    """Decode a base64-encoded JSON body while it is being downloaded.
+
+    Each chunk is decoded as it arrives into one growing buffer, so the raw
+    base64 text is never held in memory in full. Bytes outside the base64
+    alphabet are dropped first, as :func:`base64.b64decode` does.
+
+    Args:
+        chunks: Raw response body chunks, e.g. ``response.iter_content()``.
+
+    Returns:
+        Parsed JSON value.
+
+    Raises:
+        DataProcessingError: If the body is empty.
+    """
+    decoded = bytearray()
+    pending = b""
+    received = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        received = True
+        pending += chunk.translate(None, _B64_DISCARD)
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            decoded += b64decode(pending[:usable])
+            pending = pending[usable:]
+    if not received:
+        raise DataProcessingError("Response content is empty")
+    if pending:
+        decoded += b64decode(pending)
+    return _json_loads(decoded)
+
+
+def _log_if_verbose(message: str, verbose: bool, *args: Any) -> None:
     """Print message only if verbose mode is enabled.
 
     Args:
-        message: Message to print.
+        message: Message to print, optionally with %-style placeholders.
         verbose: Whether verbose mode is enabled.
+        *args: Placeholder values; formatted only when the message is printed.
     """
     if verbose:
-        print(message)
+        print(message % args if args else message)
+
+
+# Hosts whose certificates failed verification but which answered once
+# verification was disabled; later requests to them skip the doomed attempt.
+# urllib3 emits an InsecureRequestWarning naming the host for every such
+# unverified request, so no warning of our own is added on top.
+_UNVERIFIED_HOSTS: Set[str] = set()
+
+
+def _initial_verify(url: str, verify_ssl: bool, max_retries: int) -> bool:
+    """Choose the ``verify`` setting for the first attempt at ``url``.
+
+    Args:
+        url: URL about to be requested.
+        verify_ssl: Whether the caller asked for SSL verification.
+        max_retries: Maximum retry attempts; the unverified fallback is only
+            used when retries are allowed.
+
+    Returns:
+        False if the host is known to need the unverified fallback, otherwise
+        ``verify_ssl``.
+    """
+    if verify_ssl and max_retries > 0 and urlsplit(url).netloc in _UNVERIFIED_HOSTS:
+        return False
+    return verify_ssl
 
 
 def safe_get(
@@ -387,6 +843,8 @@ def safe_get(
     timeout: int = DEFAULT_TIMEOUT,
     verify_ssl: bool = True,
     verbose: bool = False,
+    headers: Optional[Dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """Make HTTP GET request with retry logic.
 
@@ -396,6 +854,10 @@ def safe_get(
         timeout: Request timeout.
         verify_ssl: Whether to verify SSL certificates.
         verbose: Whether to print status messages.
+        headers: Optional extra headers merged over the default headers.
+        session: Session to send the request on, e.g. for test isolation.
+            Defaults to the pooled session from :func:`get_session`; it is
+            never closed by this call.
 
     Returns:
         requests.Response object.
@@ -403,56 +865,87 @@ def safe_get(
     Raises:
         NetworkError: If request fails after all retries.
     """
-    for attempt in range(max_retries + 1):
-        try:
-            response = requests.get(
-                url, headers=DEFAULT_HEADERS, timeout=timeout, verify=verify_ssl
-            )
-            response.raise_for_status()
-            return response
+    request_headers = {**DEFAULT_HEADERS, **(headers or {})}
+    if session is None:
+        session = get_session(max_retries)
 
-        except requests.exceptions.SSLError as e:
-            _log_if_verbose(
-                f"SSL Error on attempt {attempt + 1}/{max_retries + 1}: {e}", verbose
-            )
+    verify = _initial_verify(url, verify_ssl, max_retries)
 
-            if attempt < max_retries:
-                try:
-                    _log_if_verbose(
-                        "Retrying with SSL verification disabled...", verbose
-                    )
-                    response = requests.get(
-                        url, headers=DEFAULT_HEADERS, timeout=timeout, verify=False
-                    )
-                    response.raise_for_status()
-                    _log_if_verbose(
-                        "Request succeeded with SSL verification disabled", verbose
-                    )
-                    return response
-                except Exception as fallback_error:
-                    _log_if_verbose(f"Fallback also failed: {fallback_error}", verbose)
-
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.RequestException,
-        ) as e:
-            _log_if_verbose(
-                f"Request error on attempt {attempt + 1}/{max_retries + 1}: {e}",
-                verbose,
-            )
+    try:
+        response = session.get(
+            url, headers=request_headers, timeout=timeout, verify=verify
+        )
+        response.raise_for_status()
+        return response
+
+    except requests.exceptions.SSLError as e:
+        _log_if_verbose("SSL Error: %s", verbose, e)
+        if max_retries > 0:
+            try:
+                _log_if_verbose("Retrying with SSL verification disabled...", verbose)
+                response = session.get(
+                    url, headers=request_headers, timeout=timeout, verify=False
+                )
+                _UNVERIFIED_HOSTS.add(urlsplit(url).netloc)
+                response.raise_for_status()
+                _log_if_verbose(
+                    "Request succeeded with SSL verification disabled", verbose
+                )
+                return response
+            except requests.exceptions.RequestException as fallback_error:
+                _log_if_verbose("Fallback also failed: %s", verbose, fallback_error)
 
-        # Wait before retrying (exponential backoff)
-        if attempt < max_retries:
-            wait_time = DEFAULT_BACKOFF_FACTOR * (2**attempt)
-            _log_if_verbose(f"Waiting {wait_time:.1f} seconds before retry...", verbose)
-            time.sleep(wait_time)
+    except requests.exceptions.RequestException as e:
+        _log_if_verbose("Request error: %s", verbose, e)
 
     raise NetworkError(
         f"Failed to fetch data from {url} after {max_retries + 1} attempts"
     )
 
 
+def fetch_many(
+    urls: List[str],
+    max_workers: int = 8,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    timeout: int = DEFAULT_TIMEOUT,
+    verify_ssl: bool = True,
+    verbose: bool = False,
+) -> List[requests.Response]:
+    """Fetch several URLs concurrently with :func:`safe_get`.
+
+    Requests run on a thread pool and share the pooled session, which is
+    safe for concurrent GETs since each call gets its own response object.
+
+    Args:
+        urls: URLs to fetch.
+        max_workers: Maximum number of concurrent requests.
+        max_retries: Maximum retry attempts per URL.
+        timeout: Request timeout.
+        verify_ssl: Whether to verify SSL certificates.
+        verbose: Whether to print status messages.
+
+    Returns:
+        Responses in the same order as ``urls``.
+
+    Raises:
+        NetworkError: If any request fails after all retries.
+    """
+    if not urls:
+        return []
+
+    def fetch(url: str) -> requests.Response:
+        return safe_get(
+            url,
+            max_retries=max_retries,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            verbose=verbose,
+        )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(fetch, urls))
+
+
 def safe_post(
     url: str,
     headers: Dict[str, str],
@@ -463,6 +956,7 @@ def safe_post(
     timeout: int = 30,
     verify_ssl: bool = True,
     verbose: bool = False,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
     """Make robust POST request with retry logic and base64 decoding.
 
@@ -476,6 +970,9 @@ def safe_post(
         timeout: Request timeout in seconds.
         verify_ssl: Whether to verify SSL certificates.
         verbose: Whether to print status messages.
+        session: Session to send the request on, e.g. for test isolation.
+            Defaults to the pooled session from :func:`get_session`; it is
+            never closed by this call.
 
     Returns:
         Parsed JSON response as dictionary.
@@ -495,109 +992,306 @@ def safe_post(
     elif not isinstance(cookies, dict):
         raise ValueError("Cookies must be a dictionary or None")
 
+    if session is None:
+        session = get_session(max_retries, backoff_factor)
+    request_kwargs = {
+        "url": url,
+        "headers": headers,
+        "data": data,
+        "cookies": cookies,
+        "timeout": timeout,
+        "stream": True,
+    }
+    failure = f"Failed to fetch data from {url} after {max_retries + 1} attempts"
+
+    verify = _initial_verify(url, verify_ssl, max_retries)
+
+    _log_if_verbose("Making POST request to %s", verbose, url)
+    try:
+        response = session.post(**request_kwargs, verify=verify)
+    except requests.exceptions.SSLError as e:
+        _log_if_verbose("SSL Error: %s", verbose, e)
+        if max_retries == 0:
+            raise NetworkError(failure) from e
+        try:
+            _log_if_verbose("Retrying with SSL verification disabled...", verbose)
+            response = session.post(**request_kwargs, verify=False)
+            _UNVERIFIED_HOSTS.add(urlsplit(url).netloc)
+        except requests.exceptions.RequestException as fallback_error:
+            _log_if_verbose("SSL fallback also failed: %s", verbose, fallback_error)
+            raise NetworkError(failure) from fallback_error
+    except requests.exceptions.RequestException as e:
+        _log_if_verbose("Request error: %s", verbose, e)
+        raise NetworkError(failure) from e
+
+    with response:
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            _log_if_verbose("HTTP Error: %s", verbose, e)
+            # Client errors (4xx) are reported as such; retryable ones such as
+            # 429 have already been retried by the session
+            if 400 <= response.status_code < 500:
+                raise NetworkError(f"HTTP {response.status_code} error: {e}") from e
+            raise NetworkError(failure) from e
+
+        _log_if_verbose(
+            "Request successful (Status: %s)", verbose, response.status_code
+        )
+
+        # Decode the body as it streams in rather than buffering it whole
+        try:
+            return _decode_base64_json_stream(response.iter_content(65536))
+        except DataProcessingError:
+            raise
+        except requests.exceptions.RequestException as e:
+            raise NetworkError(failure) from e
+        except Exception as decode_error:
+            raise DataProcessingError(
+                f"Failed to decode base64 or parse JSON: {decode_error}"
+            ) from decode_error
+
+
+def create_async_client(
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    timeout: float = DEFAULT_TIMEOUT,
+    verify_ssl: bool = True,
+) -> "httpx.AsyncClient":
+    """Create an ``httpx.AsyncClient`` for concurrent POST requests.
+
+    HTTP/2 is enabled when the ``h2`` package is installed, so concurrent
+    requests to the same host are multiplexed over a single connection.
+    As with :func:`get_session`, cookies set by servers are not persisted.
+
+    Args:
+        max_connections: Maximum number of open connections.
+        max_keepalive_connections: Maximum number of idle keep-alive connections.
+        timeout: Request timeout in seconds.
+        verify_ssl: Whether to verify SSL certificates.
+
+    Returns:
+        Configured async client; close it with ``await client.aclose()``.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for async requests. "
+            "Install it with: pip install 'vayuayan[async]'"
+        )
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    client = httpx.AsyncClient(
+        http2=http2,
+        timeout=timeout,
+        verify=verify_ssl,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
+    client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return client
+
+
+async def safe_post_async(
+    client: "httpx.AsyncClient",
+    url: str,
+    headers: Dict[str, str],
+    data: Union[Dict[str, Any], str, bytes],
+    cookies: Optional[Dict[str, str]] = None,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """Async counterpart of :func:`safe_post` built on an httpx client.
+
+    Retries transport errors and retryable status codes with exponential
+    backoff, then decodes the base64 JSON body.
+
+    Args:
+        client: Client from :func:`create_async_client`.
+        url: URL to send POST request to.
+        headers: Request headers.
+        data: Request data (dict, string, or bytes).
+        cookies: Optional cookies dict.
+        max_retries: Maximum number of retry attempts.
+        backoff_factor: Backoff factor for exponential retry delay.
+        verbose: Whether to print status messages.
+
+    Returns:
+        Parsed JSON response as dictionary.
+
+    Raises:
+        NetworkError: If all retries failed or network issues.
+        DataProcessingError: If base64 decoding or JSON parsing fails.
+        ValueError: If input parameters are invalid.
+    """
+    if not url or not isinstance(url, str):
+        raise ValueError("URL must be a non-empty string")
+    if not headers or not isinstance(headers, dict):
+        raise ValueError("Headers must be a non-empty dictionary")
+    if cookies is not None and not isinstance(cookies, dict):
+        raise ValueError("Cookies must be a dictionary or None")
+
+    request_headers = dict(headers)
+    if cookies:
+        request_headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+    body = {"data": data} if isinstance(data, dict) else {"content": data}
+    failure = f"Failed to fetch data from {url} after {max_retries + 1} attempts"
+
+    _log_if_verbose("Making async POST request to %s", verbose, url)
     for attempt in range(max_retries + 1):
+        if attempt:
+            await asyncio.sleep(backoff_factor * (2 ** (attempt - 1)))
         try:
-            _log_if_verbose(
-                f"Attempt {attempt + 1}/{max_retries + 1}: Making POST request to {url}",
-                verbose,
-            )
+            response = await client.post(url, headers=request_headers, **body)
+        except httpx.HTTPError as e:
+            _log_if_verbose("Request error: %s", verbose, e)
+            if attempt == max_retries:
+                raise NetworkError(failure) from e
+            continue
+        if response.status_code in RETRY_STATUS_CODES and attempt < max_retries:
+            continue
+        break
 
-            response = requests.post(
-                url=url,
-                headers=headers,
-                data=data,
-                cookies=cookies,
-                timeout=timeout,
-                verify=verify_ssl,
-            )
-            response.raise_for_status()
+    if response.is_error:
+        _log_if_verbose("HTTP Error: %s", verbose, response.status_code)
+        if 400 <= response.status_code < 500:
+            raise NetworkError(f"HTTP {response.status_code} error")
+        raise NetworkError(failure)
 
-            _log_if_verbose(
-                f"Request successful (Status: {response.status_code})", verbose
-            )
+    if not response.content:
+        raise DataProcessingError("Response content is empty")
+    try:
+        return decode_base64_json(response.content)
+    except Exception as decode_error:
+        raise DataProcessingError(
+            f"Failed to decode base64 or parse JSON: {decode_error}"
+        ) from decode_error
 
-            # Process the response
-            try:
-                if not response.content:
-                    raise DataProcessingError("Response content is empty")
 
-                decoded_data = b64decode(response.content)
-                json_data = json.loads(decoded_data)
-                return json_data
+async def post_many_async(
+    requests_data: List[Tuple[str, Dict[str, str], Union[Dict[str, Any], str, bytes]]],
+    cookies: Optional[Dict[str, str]] = None,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+    max_connections: int = 100,
+    verbose: bool = False,
+) -> List[Dict[str, Any]]:
+    """Send several POST requests concurrently on one async client.
 
-            except Exception as decode_error:
-                raise DataProcessingError(
-                    f"Failed to decode base64 or parse JSON: {decode_error}"
-                ) from decode_error
+    Args:
+        requests_data: ``(url, headers, data)`` tuples to post.
+        cookies: Optional cookies dict sent with every request.
+        max_retries: Maximum retry attempts per request.
+        backoff_factor: Backoff factor for exponential retry delay.
+        max_connections: Maximum number of open connections.
+        verbose: Whether to print status messages.
 
-        except requests.exceptions.SSLError as e:
-            _log_if_verbose(
-                f"SSL Error on attempt {attempt + 1}/{max_retries + 1}: {e}", verbose
-            )
+    Returns:
+        Parsed responses in the same order as ``requests_data``.
 
-            if attempt < max_retries:
-                try:
-                    _log_if_verbose(
-                        "Retrying with SSL verification disabled...", verbose
-                    )
-                    response = requests.post(
-                        url=url,
-                        headers=headers,
-                        data=data,
+    Raises:
+        NetworkError: If any request fails after all retries.
+        DataProcessingError: If any response cannot be decoded.
+    """
+    if not requests_data:
+        return []
+
+    client = create_async_client(max_connections=max_connections)
+    async with client:
+        return list(
+            await asyncio.gather(
+                *(
+                    safe_post_async(
+                        client,
+                        url,
+                        headers,
+                        data,
                         cookies=cookies,
-                        timeout=timeout,
-                        verify=False,
+                        max_retries=max_retries,
+                        backoff_factor=backoff_factor,
+                        verbose=verbose,
                     )
-                    response.raise_for_status()
+                    for url, headers, data in requests_data
+                )
+            )
+        )
 
-                    decoded_data = b64decode(response.content)
-                    json_data = json.loads(decoded_data)
-                    _log_if_verbose(
-                        "Request succeeded with SSL verification disabled", verbose
-                    )
-                    return json_data
 
-                except Exception as fallback_error:
-                    _log_if_verbose(
-                        f"SSL fallback also failed: {fallback_error}", verbose
-                    )
+_SCALAR_TYPES = (str, int, float, bool, type(None))
 
-        except requests.exceptions.HTTPError as e:
-            _log_if_verbose(
-                f"HTTP Error on attempt {attempt + 1}/{max_retries + 1}: {e}", verbose
-            )
-            # For client errors (4xx), don't retry
-            if (
-                hasattr(e.response, "status_code")
-                and 400 <= e.response.status_code < 500
-            ):
-                raise NetworkError(f"HTTP {e.response.status_code} error: {e}") from e
-
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-            requests.exceptions.RequestException,
-        ) as e:
-            _log_if_verbose(
-                f"Request error on attempt {attempt + 1}/{max_retries + 1}: {e}",
-                verbose,
-            )
 
-        except DataProcessingError:
-            # Don't retry data processing errors
-            raise
+@functools.lru_cache(maxsize=1024)
+def _url_encode_cached(items: Tuple[Tuple[str, type, Any], ...]) -> bytes:
+    """Encode a flat payload given as ``(key, type, value)`` triples."""
+    return b64encode(_json_dumps({key: value for key, _, value in items}))
 
-        # Wait before retrying (exponential backoff)
-        if attempt < max_retries:
-            wait_time = backoff_factor * (2**attempt)
-            _log_if_verbose(f"Waiting {wait_time:.1f} seconds before retry...", verbose)
-            time.sleep(wait_time)
 
-    raise NetworkError(
-        f"Failed to fetch data from {url} after {max_retries + 1} attempts"
+def _url_encode_bytes(data_dict: Dict[str, Any]) -> bytes:
+    """Encode dictionary as base64 JSON bytes, ready to send as a request body.
+
+    Flat payloads of scalar values are cached, since many requests repeat the
+    same template. The key keeps insertion order and value types, so cached
+    results are identical to encoding the dictionary directly.
+
+    Args:
+        data_dict: Dictionary to encode.
+
+    Returns:
+        Base64 encoded JSON bytes.
+    """
+    if all(type(value) in _SCALAR_TYPES for value in data_dict.values()):
+        return _url_encode_cached(
+            tuple((key, type(value), value) for key, value in data_dict.items())
+        )
+    return b64encode(_json_dumps(data_dict))
+
+
+# JSON skeleton of the live station query, filled in without json.dumps
+_STATION_DATE_TEMPLATE = b'{"station_id":"%s","date":"%s"}'
+
+
+def _json_safe_ascii(value: Any) -> bool:
+    """Whether a value is a string that JSON encodes verbatim between quotes."""
+    return (
+        isinstance(value, str)
+        and value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and "\\" not in value
     )
 
 
+def _station_date_body(station_id: str, date_time: str) -> bytes:
+    """Encode a ``{"station_id", "date"}`` payload as base64 JSON bytes.
+
+    Station ids and ISO timestamps are plain ASCII, so the JSON document is
+    formatted straight from a template. Anything that would need escaping
+    goes through the general encoder instead.
+
+    Args:
+        station_id: Station ID.
+        date_time: Date and time of the query.
+
+    Returns:
+        Base64 encoded JSON bytes, identical to :func:`_url_encode_bytes`.
+    """
+    if _json_safe_ascii(station_id) and _json_safe_ascii(date_time):
+        return b64encode(
+            _STATION_DATE_TEMPLATE % (station_id.encode(), date_time.encode())
+        )
+    return _url_encode_bytes({"station_id": station_id, "date": date_time})
+
+
 def url_encode(data_dict: Dict[str, Any]) -> str:
     """Encode dictionary as base64 JSON string.
 
@@ -607,8 +1301,7 @@ def url_encode(data_dict: Dict[str, Any]) -> str:
     Returns:
         Base64 encoded JSON string.
     """
-    raw_body = json.dumps(data_dict)
-    return b64encode(raw_body.encode()).decode("utf-8")
+    return _url_encode_bytes(data_dict).decode("ascii")
 
 
 def time_to_isodate(timestamp: int) -> str:
@@ -620,14 +1313,55 @@ def time_to_isodate(timestamp: int) -> str:
     Returns:
         ISO formatted date string.
     """
-    datetime_object = datetime.utcfromtimestamp(timestamp / 1000)
-    return datetime_object.strftime("%Y-%m-%dT%H:%M:%SZ")
+    tm = time.gmtime(timestamp // 1000)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z"
+    )
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in kilometers between two points given in degrees.
+
+    The math functions are imported by name so each call is a single global
+    lookup rather than a module attribute access.
+    """
+    # Convert to radians
+    lat1 = radians(lat1)
+    lon1 = radians(lon1)
+    lat2 = radians(lat2)
+    lon2 = radians(lon2)
+
+    # Haversine formula
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = sin(dlat * 0.5) ** 2 + cos(lat1) * cos(lat2) * sin(dlon * 0.5) ** 2
+
+    # Earth's radius in kilometers
+    return 2 * asin(sqrt(a)) * 6371
+
+
+if numba is not None:
+    # The geo kernels are serial and compiled with nogil, so threads calling
+    # them (for example nearest-station lookups from a thread pool) run in
+    # parallel; parallel=True kernels would abort when launched concurrently
+    # under numba's default workqueue threading layer
+    _haversine_km = numba.njit(cache=True, nogil=True)(_haversine_km)
+
+    @numba.njit(cache=True, nogil=True)
+    def _haversine_to_many(
+        lat1: float, lon1: float, lats: np.ndarray, lons: np.ndarray, out: np.ndarray
+    ) -> None:
+        """Write the distance from one point to every point into ``out``."""
+        for i in range(lats.size):
+            out[i] = _haversine_km(lat1, lon1, lats[i], lons[i])
 
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate great circle distance between two points using Haversine formula.
 
-    More accurate than Euclidean distance for geographical coordinates.
+    More accurate than Euclidean distance for geographical coordinates. Runs
+    as native code when numba is installed.
 
     Args:
         lat1, lon1: Latitude and longitude of first point.
@@ -636,22 +1370,137 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in kilometers.
     """
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    return _haversine_km(float(lat1), float(lon1), float(lat2), float(lon2))
+
+
+def haversine_many(
+    lat1: Union[float, np.ndarray],
+    lon1: Union[float, np.ndarray],
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> np.ndarray:
+    """Calculate great circle distances between points given as arrays.
+
+    NumPy counterpart of haversine_distance. Inputs broadcast against each
+    other, so a scalar reference point gives one-to-many distances and
+    equally shaped arrays give element-wise distances. For a single pair of
+    points haversine_distance is faster, since the ``math`` functions avoid
+    NumPy's per-call overhead.
+
+    Args:
+        lat1, lon1: Latitude(s) and longitude(s) of the reference point(s).
+        lats, lons: Latitudes and longitudes of the other points.
+
+    Returns:
+        Array of distances in kilometers.
+    """
+    if numba is not None and np.ndim(lat1) == 0 and np.ndim(lon1) == 0:
+        lats = np.ascontiguousarray(lats, dtype=np.float64)
+        lons = np.ascontiguousarray(lons, dtype=np.float64)
+        if lats.ndim == 1 and lats.shape == lons.shape:
+            # One-to-many: compiled loop without intermediate arrays
+            distances = np.empty(lats.size)
+            _haversine_to_many(float(lat1), float(lon1), lats, lons, distances)
+            return distances
+
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lats = np.radians(np.asarray(lats, dtype=np.float64))
+    lons = np.radians(np.asarray(lons, dtype=np.float64))
 
     # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
     a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        np.sin((lats - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lats) * np.sin((lons - lon1) / 2) ** 2
     )
-    c = 2 * math.asin(math.sqrt(a))
+    c = 2 * np.arcsin(np.sqrt(a))
 
     # Earth's radius in kilometers
     return c * 6371
 
 
+class StationDistanceIndex:
+    """Great-circle distances from query points to a fixed set of stations.
+
+    Station coordinates are converted to radians and the cosine of every
+    station latitude is taken once, at construction, so a query only
+    evaluates the terms that depend on the query point.
+
+    Args:
+        lats, lons: Station latitudes and longitudes in degrees.
+    """
+
+    def __init__(self, lats: np.ndarray, lons: np.ndarray) -> None:
+        self._lat_rad = np.radians(np.asarray(lats, dtype=np.float64))
+        self._lon_rad = np.radians(np.asarray(lons, dtype=np.float64))
+        self._cos_lat = np.cos(self._lat_rad)
+
+    def __len__(self) -> int:
+        return len(self._lat_rad)
+
+    def query(self, lat: float, lon: float) -> np.ndarray:
+        """Calculate distances from a point to every station.
+
+        Args:
+            lat, lon: Latitude and longitude of the query point.
+
+        Returns:
+            Array of distances in kilometers, in station order.
+        """
+        lat1 = np.radians(np.float64(lat))
+        lon1 = np.radians(np.float64(lon))
+
+        if numba is not None:
+            distances = np.empty(len(self._lat_rad))
+            _haversine_prepared(
+                lat1, lon1, self._lat_rad, self._lon_rad, self._cos_lat, distances
+            )
+            return distances
+
+        # Haversine formula with the station-only terms precomputed, evaluated
+        # in place so only three temporaries of station length are allocated
+        lat_term = np.subtract(self._lat_rad, lat1)
+        lat_term /= 2
+        np.sin(lat_term, out=lat_term)
+        lat_term **= 2
+        lon_term = np.subtract(self._lon_rad, lon1)
+        lon_term /= 2
+        np.sin(lon_term, out=lon_term)
+        lon_term **= 2
+        scale = np.multiply(np.cos(lat1), self._cos_lat)
+        scale *= lon_term
+        lat_term += scale
+        np.sqrt(lat_term, out=lat_term)
+        np.arcsin(lat_term, out=lat_term)
+        lat_term *= 2
+
+        # Earth's radius in kilometers
+        lat_term *= 6371
+        return lat_term
+
+
+if numba is not None:
+
+    # Serial and nogil like the geo kernels above, for thread-pool callers
+    @numba.njit(cache=True, nogil=True)
+    def _haversine_prepared(
+        lat1: float,
+        lon1: float,
+        lat_rad: np.ndarray,
+        lon_rad: np.ndarray,
+        cos_lat: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """Fused haversine from one point (radians) to prepared station arrays."""
+        cos_lat1 = math.cos(lat1)
+        for i in range(lat_rad.size):
+            a = (
+                math.sin((lat_rad[i] - lat1) / 2) ** 2
+                + cos_lat1 * cos_lat[i] * math.sin((lon_rad[i] - lon1) / 2) ** 2
+            )
+            out[i] = 2 * math.asin(math.sqrt(a)) * 6371
+
+
 def euclidean_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate simple Euclidean distance.
 
@@ -667,6 +1516,100 @@ def euclidean_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return math.sqrt((lat1 - lat2) ** 2 + (lon1 - lon2) ** 2)
 
 
+# One pattern covering the DATE_FORMATS layouts, dispatched on the name of the
+# alternative that matched, before falling back to trying each format with
+# strptime
+_DATE_RE = re.compile(
+    r"(?P<iso>(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2}))"
+    r"|(?P<numeric>(?P<num_day>\d{1,2})(?P<num_sep>[-/])(?P<num_month>\d{1,2})"
+    r"(?P=num_sep)(?P<num_year>\d{4}|\d{2}))"
+    r"|(?P<dmy>(?P<dmy_day>\d{1,2})\s+(?P<dmy_month>[A-Za-z]+)\s+"
+    r"(?P<dmy_year>\d{4}|\d{2}))"
+    r"|(?P<mdy>(?P<mdy_month>[A-Za-z]+)\s+(?P<mdy_day>\d{1,2})(?P<mdy_comma>,?)\s+"
+    r"(?P<mdy_year>\d{4}))"
+)
+
+_FULL_MONTH_NUMBERS: Dict[str, int] = {
+    name.lower(): int(MONTH_ABBREV[name[:3].lower()]) for name in MONTHS
+}
+
+
+def _year_from_text(year_text: str) -> int:
+    """Convert a 2- or 4-digit year to a full year, following strptime's %y rules.
+
+    Args:
+        year_text: Year digits.
+
+    Returns:
+        Full year.
+    """
+    year = int(year_text)
+    if len(year_text) == 2:
+        year += 2000 if year <= 68 else 1900
+    return year
+
+
+def _month_from_name(name: str, allow_full: bool) -> Optional[int]:
+    """Look up a month number from its abbreviation or full name.
+
+    Args:
+        name: Month name, matched case-insensitively.
+        allow_full: Whether full month names are accepted as well as abbreviations.
+
+    Returns:
+        Month number (1-12), or None if not recognised.
+    """
+    key = name.lower()
+    if len(key) == 3 and key in MONTH_ABBREV:
+        return int(MONTH_ABBREV[key])
+    if allow_full:
+        return _FULL_MONTH_NUMBERS.get(key)
+    return None
+
+
+def _match_date(date_text: str) -> Optional[datetime]:
+    """Parse a date in one of the DATE_FORMATS layouts using precompiled patterns.
+
+    Args:
+        date_text: Cleaned date text.
+
+    Returns:
+        Parsed datetime, or None if no pattern matches.
+
+    Raises:
+        ValueError: If a pattern matches but the date is invalid.
+    """
+    match = _DATE_RE.fullmatch(date_text)
+    if match is None:
+        return None
+    layout = match.lastgroup
+
+    if layout == "iso":
+        return datetime(
+            int(match["iso_year"]), int(match["iso_month"]), int(match["iso_day"])
+        )
+
+    if layout == "numeric":
+        # Day-first, as DATE_FORMATS lists %d/%m/%Y before %m/%d/%Y
+        return datetime(
+            _year_from_text(match["num_year"]),
+            int(match["num_month"]),
+            int(match["num_day"]),
+        )
+
+    if layout == "dmy":
+        year_text = match["dmy_year"]
+        month = _month_from_name(match["dmy_month"], allow_full=len(year_text) == 4)
+        if month:
+            return datetime(_year_from_text(year_text), month, int(match["dmy_day"]))
+        return None
+
+    month = _month_from_name(match["mdy_month"], allow_full=bool(match["mdy_comma"]))
+    if month:
+        return datetime(int(match["mdy_year"]), month, int(match["mdy_day"]))
+    return None
+
+
 def parse_date(date_text: str) -> Optional[str]:
     """Parse various date formats to standardized format.
 
@@ -680,7 +1623,14 @@ def parse_date(date_text: str) -> Optional[str]:
         return None
 
     # Clean the date text
-    date_text = re.sub(r"[^\w\s\/\-,:]", "", date_text.strip())
+    date_text = _RE_DATE_NOISE.sub("", date_text.strip())
+
+    try:
+        parsed_date = _match_date(date_text)
+    except ValueError:
+        parsed_date = None
+    if parsed_date is not None:
+        return parsed_date.strftime("%Y-%m-%d")
 
     for fmt in DATE_FORMATS:
         try:
@@ -692,6 +1642,27 @@ def parse_date(date_text: str) -> Optional[str]:
     return None
 
 
+def parse_dates(dates: Union[pd.Series, List[str]]) -> pd.Series:
+    """Parse many date strings to the standardized format at once.
+
+    Each distinct value is parsed only once, which is much cheaper than
+    calling :func:`parse_date` per row on columns with repeated dates.
+
+    Args:
+        dates: Raw date texts.
+
+    Returns:
+        Series aligned with ``dates`` holding YYYY-MM-DD strings, or None
+        where parsing fails.
+    """
+    series = pd.Series(dates, dtype=object)
+    parsed = {
+        value: parse_date(value) for value in series.unique() if isinstance(value, str)
+    }
+    result = series.map(parsed)
+    return result.astype(object).where(result.notna(), None)
+
+
 def clean_city_name(city_text: str) -> Optional[str]:
     """Clean and standardize city name.
 
@@ -705,52 +1676,85 @@ def clean_city_name(city_text: str) -> Optional[str]:
         return None
 
     # Remove extra whitespace
-    city = re.sub(r"\s+", " ", city_text.strip())
-    # Remove parentheses content
-    city = re.sub(r"\s*\([^)]*\)", "", city)
+    city = _RE_WS.sub(" ", city_text.strip())
+    # Remove parentheses content; substring checks let the common clean
+    # names skip the regex scans entirely
+    if "(" in city:
+        city = _RE_PAREN.sub("", city)
     # Remove common prefixes/suffixes
-    city = re.sub(r"^(For|Weather|Report|Forecast):\s*", "", city, flags=re.IGNORECASE)
-    city = re.sub(r"\s*(Weather|Report|Forecast)$", "", city, flags=re.IGNORECASE)
+    city = _RE_AFFIX.sub("", city)
     # Remove HTML artifacts
-    city = re.sub(r"[<>]", "", city)
+    if "<" in city or ">" in city:
+        city = _RE_HTML.sub("", city)
     # Capitalize properly
     city = city.title()
     # Normalize hyphens
-    city = re.sub(r"\s*-\s*", "-", city)
+    if "-" in city:
+        city = _RE_DASH.sub("-", city)
 
     return city.strip()
 
 
-def convert_date_to_iso(date_str: str) -> Optional[str]:
-    """Convert dates like "27-May", "2-Jun" to YYYY-MM-DD format.
+_DAY_MONTH_RE = re.compile(r"\s*(\d{1,2})[\s-]+([A-Za-z]{3,9})\s*$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _month_day_from_text(date_str: str) -> Optional[str]:
+    """Parse the year-independent "MM-DD" part of a "DD-MMM" date.
+
+    Cached, since the same handful of dates recur across API responses.
 
     Args:
-        date_str: Date string in format "DD-MMM" (e.g., "27-May", "2-Jun").
+        date_str: Date string in format "DD-MMM".
 
     Returns:
-        Date in YYYY-MM-DD format, or None if parsing fails.
+        Month and day as "MM-DD", or None if parsing fails.
     """
-    if not date_str:
+    match = _DAY_MONTH_RE.match(date_str)
+    if match is None:
+        return None
+
+    # Convert month abbreviation to number
+    month = MONTH_ABBREV.get(match[2][:3].lower())
+    if month is None:
         return None
 
-    current_year = datetime.now().year
+    return f"{month}-{match[1].zfill(2)}"
+
+
+# Current year and the epoch time at which the next year begins
+_YEAR_CACHE: Tuple[int, float] = (0, -math.inf)
+
+
+def _current_year() -> int:
+    """Return the current year, rebuilding it only when a new year begins.
+
+    Returns:
+        Current calendar year.
+    """
+    global _YEAR_CACHE
+    year, next_year_start = _YEAR_CACHE
+    if time.time() >= next_year_start:
+        year = datetime.now().year
+        # Local midnight on 1 January, matching datetime.now()
+        _YEAR_CACHE = (year, datetime(year + 1, 1, 1).timestamp())
+    return year
 
-    try:
-        # Split by dash and clean
-        parts = date_str.strip().replace("-", " ").replace("  ", " ").split(" ")
-        if len(parts) != 2:
-            return None
 
-        day, month_abbr = parts
-        day = day.zfill(2)  # Convert to 2-digit format
+def convert_date_to_iso(date_str: str) -> Optional[str]:
+    """Convert dates like "27-May", "2-Jun" to YYYY-MM-DD format.
 
-        # Convert month abbreviation to number
-        month_key = month_abbr.lower()[:3]
-        if month_key not in MONTH_ABBREV:
-            return None
+    Args:
+        date_str: Date string in format "DD-MMM" (e.g., "27-May", "2-Jun").
 
-        month = MONTH_ABBREV[month_key]
-        return f"{current_year}-{month}-{day}"
+    Returns:
+        Date in YYYY-MM-DD format, or None if parsing fails.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
 
-    except Exception:
+    month_day = _month_day_from_text(date_str)
+    if month_day is None:
         return None
+
+    return f"{_current_year()}-{month_day}"